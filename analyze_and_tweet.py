@@ -8,7 +8,6 @@ Usage:
     python analyze_and_tweet.py --help       # Show help
 """
 import argparse
-import asyncio
 import sys
 import tempfile
 from pathlib import Path
@@ -19,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from git_storyteller.core.git_analyzer import GitAnalyzer
 from git_storyteller.core.visual_engine import VisualEngine
 from git_storyteller.core.browser_automation import BrowserAutomation
+from git_storyteller.utils.aio import run
 
 
 def get_user_confirmation() -> bool:
@@ -158,6 +158,8 @@ async def main(mode: str, repo_path: str = None):
     except Exception as e:
         print(f"  ✗ Failed to generate visual: {e}")
         image_path = None
+    finally:
+        await visual_engine.close()
 
     # Step 4: Generate tweet content
     print("\n[4/5] Crafting tweet content...")
@@ -315,7 +317,7 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
-    success = asyncio.run(main(mode=mode, repo_path=args.repo))
+    success = run(main(mode=mode, repo_path=args.repo))
 
     print("\n" + "=" * 60)
     if success:
@@ -9,24 +9,31 @@ Usage:
 """
 import argparse
 import asyncio
+import hashlib
+import os
 import sys
-import json
+import orjson
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
 
 try:
     import yaml
     HAS_YAML = True
+    # libyaml's C parser when PyYAML was built with it
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from git_storyteller.core.git_analyzer import GitAnalyzer
+from git_storyteller.core.git_analyzer import GitAnalyzer, RepositoryImpact
 from git_storyteller.core.visual_engine import VisualEngine
 from git_storyteller.core.browser_automation import BrowserAutomation
+from git_storyteller.utils.aio import run
+from git_storyteller.utils.files import atomic_write_bytes
 import git
 
 
@@ -34,6 +41,14 @@ import git
 WATCH_LIST_PATH = Path(__file__).parent.parent / "config" / "watch_list.yaml"
 HISTORY_DIR = Path(__file__).parent.parent / "output" / "e2e_history"
 HISTORY_FILE = HISTORY_DIR / "watch_list_history.json"
+ANALYSIS_CACHE_DIR = HISTORY_DIR / "analysis_cache"
+REPO_CACHE_DIR = HISTORY_DIR / "repo_cache"
+
+# Analyses kept on disk per watched repo, keyed by repo URL and HEAD commit
+ANALYSIS_CACHE_PER_REPO = 2
+
+# Repositories cloned and analyzed at the same time
+MAX_PARALLEL_ANALYSES = 8
 
 # Hardcoded watch list for when yaml is not available
 SIMPLE_WATCH_LIST = {
@@ -56,30 +71,26 @@ def load_watch_list() -> dict:
     """Load the watch list configuration."""
     if HAS_YAML and WATCH_LIST_PATH.exists():
         with open(WATCH_LIST_PATH) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
     return SIMPLE_WATCH_LIST
 
 
 def load_history() -> dict:
     """Load existing commit history."""
-    if HISTORY_FILE.exists():
-        with open(HISTORY_FILE) as f:
-            return json.load(f)
-    return {}
+    try:
+        return orjson.loads(HISTORY_FILE.read_bytes())
+    except FileNotFoundError:
+        return {}
 
 
 def save_history(history: dict):
-    """Save commit history to file."""
-    HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(history, f, indent=2)
+    """Save commit history to file (atomically, so a crash never truncates it)."""
+    atomic_write_bytes(HISTORY_FILE, orjson.dumps(history, option=orjson.OPT_INDENT_2))
 
 
 def is_first_tweet(history: dict, repo_name: str) -> bool:
     """Check if this is the first tweet for a repo."""
-    if repo_name not in history:
-        return True
-    return not history[repo_name].get('tweets_sent', 0)
+    return not history.get(repo_name, {}).get('tweets_sent', 0)
 
 
 def should_skip_tweet(history: dict, repo_name: str, latest_commit_hash: str) -> bool:
@@ -87,27 +98,115 @@ def should_skip_tweet(history: dict, repo_name: str, latest_commit_hash: str) ->
     if is_first_tweet(history, repo_name):
         return False  # Never skip first tweet
 
-    last_tweeted = history[repo_name].get('last_tweeted_commit')
-    if last_tweeted == latest_commit_hash:
-        return True  # Skip if same commit as last tweet
-
-    return False
+    # Skip if same commit as last tweet
+    return history[repo_name].get('last_tweeted_commit') == latest_commit_hash
 
 
 def record_tweet_sent(history: dict, repo_name: str, commit_hash: str):
     """Record that a tweet was sent for a repo."""
-    if repo_name not in history:
-        history[repo_name] = {}
+    entry = history.setdefault(repo_name, {})
+    entry['tweets_sent'] = entry.get('tweets_sent', 0) + 1
+    entry['last_tweeted_commit'] = commit_hash
+    entry['last_tweeted_at'] = datetime.now().isoformat()
+
+
+def is_unchanged(history: dict, repo_name: str, head_sha: str) -> bool:
+    """Check if the remote HEAD is still the commit we last tweeted about."""
+    if is_first_tweet(history, repo_name) or not head_sha:
+        return False
+
+    last_tweeted = history[repo_name].get('last_tweeted_commit')
+    return bool(last_tweeted) and head_sha.startswith(last_tweeted)
+
+
+def analyze_cached(analyzer: GitAnalyzer, repo_url: str, head_sha: str = None) -> RepositoryImpact:
+    """Analyze a repository, reusing the result of an earlier run at the same HEAD.
+
+    Args:
+        analyzer: GitAnalyzer to run on a cache miss
+        repo_url: Repository URL
+        head_sha: Remote HEAD commit, or None to skip the cache
+
+    Returns:
+        RepositoryImpact analysis
+    """
+    if not head_sha:
+        return analyzer.analyze(repo_url, is_remote=True)
+
+    url_key = hashlib.sha256(repo_url.encode()).hexdigest()[:16]
+    cache_file = ANALYSIS_CACHE_DIR / f"{url_key}-{head_sha}.json"
+    try:
+        impact = RepositoryImpact.from_dict(orjson.loads(cache_file.read_bytes()))
+        os.utime(cache_file)  # Mark as recently used
+        return impact
+    except (OSError, ValueError, KeyError):
+        pass
+
+    impact = analyzer.analyze(repo_url, is_remote=True)
+    atomic_write_bytes(cache_file, orjson.dumps(impact.to_dict()))
+    return impact
+
 
-    if 'tweets_sent' not in history[repo_name]:
-        history[repo_name]['tweets_sent'] = 0
+def prune_analysis_cache(repo_count: int):
+    """Delete all but the most recently used cached analyses.
 
-    history[repo_name]['tweets_sent'] += 1
-    history[repo_name]['last_tweeted_commit'] = commit_hash
-    history[repo_name]['last_tweeted_at'] = datetime.now().isoformat()
+    Run once analyses are done, so no other thread is reading or writing
+    the cache while it is pruned.
 
+    Args:
+        repo_count: Number of watched repos the cache should hold results for
+    """
+    keep = ANALYSIS_CACHE_PER_REPO * max(repo_count, 1)
+    cached = []
+    for path in ANALYSIS_CACHE_DIR.glob("*.json"):
+        try:
+            cached.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    cached.sort()
+
+    for _, stale in cached[:-keep]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def prefetch_impacts(repos: list, history: dict, analyzer: GitAnalyzer) -> dict:
+    """Clone and analyze repositories in parallel ahead of the posting loop.
+
+    Repos without new commits are not cloned. Failed analyses get no impact
+    and are left for process_single_repo to retry and report.
+
+    Args:
+        repos: Enabled repository configurations
+        history: Commit history dictionary
+        analyzer: GitAnalyzer shared by the worker threads (it keeps no per-call state)
 
-async def process_single_repo(repo_config: dict, mode: str, history: dict, repo_index: int, total_repos: int, browser=None) -> bool:
+    Returns:
+        Mapping of repo name to (remote HEAD or None, RepositoryImpact or None)
+    """
+    def analyze(repo_config: dict):
+        head_sha = analyzer.resolve_head_sha(repo_config['url'], is_remote=True)
+        if is_unchanged(history, repo_config['name'], head_sha):
+            return head_sha, None
+        try:
+            return head_sha, analyze_cached(analyzer, repo_config['url'], head_sha)
+        except Exception:
+            return head_sha, None
+
+    prefetched = {}
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_ANALYSES) as executor:
+        futures = {executor.submit(analyze, r): r['name'] for r in repos}
+        for future in as_completed(futures):
+            try:
+                prefetched[futures[future]] = future.result()
+            except Exception:
+                continue
+    return prefetched
+
+
+async def process_single_repo(repo_config: dict, mode: str, history: dict, repo_index: int, total_repos: int, browser=None, impact=None, analyzer=None, head_sha=None) -> bool:
     """Process a single repository: analyze, generate content, and optionally post.
 
     Args:
@@ -117,6 +216,9 @@ async def process_single_repo(repo_config: dict, mode: str, history: dict, repo_
         repo_index: Index of this repo in the list (for display)
         total_repos: Total number of repos (for display)
         browser: Optional BrowserAutomation instance to reuse
+        impact: Optional RepositoryImpact already computed by prefetch_impacts
+        analyzer: Optional GitAnalyzer instance to reuse
+        head_sha: Optional remote HEAD already resolved by prefetch_impacts
 
     Returns:
         True if successful, False otherwise
@@ -130,12 +232,22 @@ async def process_single_repo(repo_config: dict, mode: str, history: dict, repo_
     print(f"URL: {repo_url}")
 
     # Check if should skip
-    analyzer = GitAnalyzer()
+    analyzer = analyzer or GitAnalyzer(clone_cache_dir=REPO_CACHE_DIR)
+
+    # Ask the remote for its HEAD before cloning; an unchanged repo needs no clone
+    if impact is None:
+        if head_sha is None:
+            head_sha = analyzer.resolve_head_sha(repo_url, is_remote=True)
+        if is_unchanged(history, repo_name, head_sha):
+            last_tweeted = history[repo_name].get('last_tweeted_commit')
+            print(f"  ⏭️  Skipped: No new commits since last tweet ({last_tweeted})")
+            return True  # Not a failure, just skipped
 
     try:
         # Analyze repository
         print(f"\n[1/4] Analyzing repository...")
-        impact = analyzer.analyze(repo_url, is_remote=True)
+        if impact is None:
+            impact = analyze_cached(analyzer, repo_url, head_sha)
 
         if not impact.recent_changes:
             print("  ⚠️  No commits found")
@@ -198,6 +310,8 @@ async def process_single_repo(repo_config: dict, mode: str, history: dict, repo_
     except Exception as e:
         print(f"  ✗ Failed to generate visual: {e}")
         image_path = None
+    finally:
+        await visual_engine.close()
 
     # Generate tweet content
     print(f"\n[3/4] Crafting tweet content...")
@@ -360,26 +474,36 @@ async def main(mode: str, single_repo: str = None):
             print("  ⚠️  Continuing without browser (will skip posting)\n")
             browser = None
 
+    # Clone and analyze every repo in parallel; posting below stays sequential
+    print("🔍 Analyzing repositories in parallel...")
+    analyzer = GitAnalyzer(clone_cache_dir=REPO_CACHE_DIR)
+    prefetched = await asyncio.to_thread(prefetch_impacts, enabled_repos, history, analyzer)
+    prune_analysis_cache(len(enabled_repos))
+
     try:
         for i, repo_config in enumerate(enabled_repos, 1):
+            head_sha, impact = prefetched.get(repo_config['name'], (None, None))
             success = await process_single_repo(
                 repo_config,
                 mode,
                 history,
                 i,
                 len(enabled_repos),
-                browser=browser
+                browser=browser,
+                impact=impact,
+                analyzer=analyzer,
+                head_sha=head_sha
             )
 
-        if success:
-            results['success'] += 1
-        else:
-            results['failed'] += 1
+            if success:
+                results['success'] += 1
+            else:
+                results['failed'] += 1
 
-        # Add delay between repos in auto mode to avoid rate limiting
-        if i < len(enabled_repos) and mode == 'auto':
-            print(f"\n⏸️  Waiting 30 seconds before next repo...")
-            await asyncio.sleep(30)
+            # Add delay between repos in auto mode to avoid rate limiting
+            if i < len(enabled_repos) and mode == 'auto':
+                print(f"\n⏸️  Waiting 30 seconds before next repo...")
+                await asyncio.sleep(30)
 
     finally:
         # Close browser after all repos are processed
@@ -460,7 +584,7 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
-    success = asyncio.run(main(mode=mode, single_repo=args.single))
+    success = run(main(mode=mode, single_repo=args.single))
 
     print("\n" + "=" * 60)
     if success:
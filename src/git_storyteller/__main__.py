@@ -1,6 +1,7 @@
 """Main entry point for git-storyteller CLI."""
 import sys
 
+from git_storyteller.config import get_config
 from git_storyteller.core.learning_system import LearningSystem
 from git_storyteller.core.mcp_server import run_server
 from git_storyteller.core.webhook_server import run_webhook_server
@@ -14,13 +15,16 @@ Git-Storyteller v1.0 - Stop coding in silence. Turn commits into viral updates.
 Usage:
   git-storyteller                    Start MCP server (default)
   git-storyteller mcp                Start MCP server
-  git-storyteller webhook [port]     Start webhook server (default port: 8080)
+  git-storyteller webhook [port] [--host HOST]
+                                     Start webhook server (default port: 8080,
+                                     host: webhook.host config, else localhost)
   git-storyteller insights           Show learning insights
   git-storyteller help               Show this help message
 
 Examples:
   git-storyteller
   git-storyteller webhook 8080
+  git-storyteller webhook 8080 --host 0.0.0.0
   git-storyteller insights
 
 Configuration: ~/.config/git-storyteller/config.yaml
@@ -69,10 +73,19 @@ def main():
     if not args or args[0] == "mcp":
         run_server()
     elif args[0] == "webhook":
-        port = int(args[1]) if len(args) > 1 else 8080
+        webhook_args = args[1:]
+        host = get_config().get("webhook.host", "localhost")
+        if "--host" in webhook_args:
+            idx = webhook_args.index("--host")
+            if idx + 1 >= len(webhook_args):
+                print("❌ --host requires a value")
+                sys.exit(1)
+            host = webhook_args[idx + 1]
+            del webhook_args[idx:idx + 2]
+        port = int(webhook_args[0]) if webhook_args else 8080
         # Get secret from environment or config
         secret = None  # Can be configured via env var
-        run_webhook_server(port=port, secret=secret)
+        run_webhook_server(port=port, secret=secret, host=host)
     elif args[0] == "insights":
         cmd_insights()
     elif args[0] in ["help", "--help", "-h"]:
@@ -4,6 +4,9 @@ from typing import Optional
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Config:
     """Configuration manager for git-storyteller."""
@@ -29,6 +32,7 @@ class Config:
         """
         defaults = {
             "mode": "autonomous",  # autonomous or semi-auto
+            "debug": False,  # Print full webhook payloads and other diagnostics
             "theme": "dark",  # dark or light
             "primary_color": "#6366f1",
             "brand_colors": ["#6366f1", "#8b5cf6", "#a855f7"],
@@ -68,12 +72,22 @@ class Config:
             "learning": {
                 "feedback_file": "~/.config/git-storyteller/learning.json",
             },
+            "analysis": {
+                # Write a commit-graph into analyzed local repositories' .git to
+                # speed up history walks (cached clones always get one)
+                "write_commit_graph": False,
+            },
+            "webhook": {
+                # Interface the webhook server binds; use 0.0.0.0 to accept
+                # deliveries from GitHub without a reverse proxy
+                "host": "localhost",
+            },
         }
 
         if self.config_path.exists():
             try:
                 with open(self.config_path, "r") as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=_YAML_LOADER) or {}
                     return self._merge_config(defaults, user_config)
             except Exception as e:
                 print(f"Warning: Could not load config from {self.config_path}: {e}")
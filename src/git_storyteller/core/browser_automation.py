@@ -1,5 +1,6 @@
 """Browser automation for stealth social media posting."""
 import asyncio
+import copy
 import random
 from pathlib import Path
 from typing import Optional
@@ -49,6 +50,19 @@ class BrowserAutomation:
         self.page = await self.context.new_page()
         return self.page
 
+    def tab(self) -> "BrowserAutomation":
+        """Create a view of this browser that posts through its own page.
+
+        The view shares the launched browser and its logged-in context, so
+        several posts can run concurrently without a second Chrome.
+
+        Returns:
+            BrowserAutomation sharing this instance's browser and context
+        """
+        view = copy.copy(self)
+        view.page = None
+        return view
+
     async def close(self):
         """Close the browser."""
         if self.browser:
@@ -385,6 +399,9 @@ class BrowserAutomation:
             return False
 
         try:
+            # Create a new page for this post
+            await self.new_page()
+
             # Navigate to LinkedIn
             await self.page.goto("https://www.linkedin.com/feed", wait_until="networkidle")
 
@@ -432,6 +449,13 @@ class BrowserAutomation:
         except Exception as e:
             print(f"❌ Failed to post to LinkedIn: {e}")
             return False
+        finally:
+            # Close the page to clean up
+            if self.page:
+                try:
+                    await self.page.close()
+                except Exception:
+                    pass
 
     async def fetch_engagement_metrics(self, platform: str) -> dict:
         """Fetch engagement metrics for recent posts.
@@ -1,12 +1,58 @@
 """Git repository analyzer for understanding code semantics."""
+import hashlib
+import os
+import shutil
 import tempfile
-from dataclasses import dataclass
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
 import git
 from tree_sitter import Language, Parser
 
+from ..config import get_config
+
+# Tweet hooks by repository maturity (see generate_sexy_tweet_content)
+_HOOK_NEW_REPO = "🚀 {repo} v1.0 is LIVE"
+_HOOK_GROWING_REPO = "🔥 {repo} keeps shipping"
+_HOOK_ESTABLISHED_REPO = "⚡ {repo} update"
+
+# Tweet layout: hook, change summary, call to action, repo reference and branding.
+# {summary} and {github} carry their own trailing newline so they can be left empty.
+_TWEET_TEMPLATE = (
+    "{hook}\n"
+    "\n"
+    "{summary}"
+    "\n"
+    "\n"
+    "👇\n"
+    "{github}"
+    "✨ Powered by theanthonyjin/git-storyteller\n"
+    "#DevTools #AI #OpenSource"
+)
+
+# Commits read per analysis; older history only contributes to the total count
+RECENT_COMMITS = 10
+
+# Fail fast instead of waiting on a credential prompt for private/missing repos
+_CLONE_ENV = {"GIT_TERMINAL_PROMPT": "0"}
+
+# Functionality keywords to tweet labels, checked in order; first match wins per commit
+_CHANGE_MATCHERS = (
+    (("mcp",), "🔌 MCP integration"),
+    (("browser", "playwright"), "🎭 Browser automation"),
+    (("visual", "template"), "🎨 Visual rendering"),
+    (("api",), "🌐 API endpoints"),
+    (("auth",), "🔐 Authentication"),
+    (("database", "db"), "🗄️ Database layer"),
+    (("ui", "frontend"), "💄 UI improvements"),
+    (("chat", "message"), "💬 Chat features"),
+    (("search",), "🔍 Search functionality"),
+    (("export", "download"), "📥 Export features"),
+)
+
 
 @dataclass
 class CommitInfo:
@@ -19,6 +65,47 @@ class CommitInfo:
     files_changed: List[str]
     diff_summary: str
     semantic_impact: str
+    message_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Cache the lowercased message for keyword scans."""
+        self.message_lower = self.message.lower()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "hash": self.hash,
+            "author": self.author,
+            "message": self.message,
+            "date": self.date,
+            "files_changed": self.files_changed,
+            "diff_summary": self.diff_summary,
+            "semantic_impact": self.semantic_impact,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CommitInfo":
+        """Create from dictionary.
+
+        Args:
+            data: Dictionary data
+
+        Returns:
+            CommitInfo instance
+        """
+        return cls(
+            hash=data["hash"],
+            author=data["author"],
+            message=data["message"],
+            date=data["date"],
+            files_changed=data["files_changed"],
+            diff_summary=data["diff_summary"],
+            semantic_impact=data["semantic_impact"],
+        )
 
 
 @dataclass
@@ -32,12 +119,54 @@ class RepositoryImpact:
     marketing_hooks: List[str]
     visual_highlights: List[str]
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary.
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "recent_changes": [c.to_dict() for c in self.recent_changes],
+            "total_commits": self.total_commits,
+            "marketing_hooks": self.marketing_hooks,
+            "visual_highlights": self.visual_highlights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RepositoryImpact":
+        """Create from dictionary.
+
+        Args:
+            data: Dictionary data
+
+        Returns:
+            RepositoryImpact instance
+        """
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            recent_changes=[CommitInfo.from_dict(c) for c in data["recent_changes"]],
+            total_commits=data["total_commits"],
+            marketing_hooks=data["marketing_hooks"],
+            visual_highlights=data["visual_highlights"],
+        )
+
 
 class GitAnalyzer:
     """Analyzes git repositories for marketing impact."""
 
-    def __init__(self):
-        """Initialize the git analyzer."""
+    def __init__(self, clone_cache_dir: Optional[Path] = None):
+        """Initialize the git analyzer.
+
+        Args:
+            clone_cache_dir: Optional directory in which remote repositories are
+                kept between runs and updated with git fetch instead of recloned
+        """
+        self.clone_cache_dir = clone_cache_dir
+        # Opt-in: a commit-graph is written into the repository's own .git
+        self.write_local_commit_graph = get_config().get("analysis.write_commit_graph", False)
         self.parser = Parser()
         self._init_languages()
 
@@ -72,28 +201,145 @@ class GitAnalyzer:
         Returns:
             RepositoryImpact analysis
         """
-        repo = self._get_repo(target, is_remote)
-        return self._analyze_repo(repo, ref)
-
-    def _get_repo(self, target: str, is_remote: bool) -> git.Repo:
+        repo = self._get_repo(target, is_remote, ref)
+        try:
+            return self._analyze_repo(repo, ref)
+        finally:
+            if is_remote and not (self.clone_cache_dir and not ref):
+                # Temporary clone: delete it without making the caller wait on the disk
+                repo.close()
+                threading.Thread(
+                    target=shutil.rmtree, args=(repo.working_dir,), kwargs={"ignore_errors": True}
+                ).start()
+
+    def _get_repo(self, target: str, is_remote: bool, ref: Optional[str] = None) -> git.Repo:
         """Get git.Repo object from path or URL.
 
         Args:
             target: Local path or GitHub URL
             is_remote: Whether target is a remote URL
+            ref: Optional branch or tag to clone directly
 
         Returns:
             git.Repo object
         """
         if is_remote:
-            # Shallow clone for remote URLs
+            if self.clone_cache_dir and not ref:
+                return self._get_cached_clone(target)
+
             temp_dir = tempfile.mkdtemp(prefix="git-storyteller-")
             print(f"Cloning {target} to {temp_dir}...")
-            # Clone full history to get accurate commit count
-            repo = git.Repo.clone_from(target, temp_dir)
-            return repo
+            # Clone full history to get accurate commit count, but skip file
+            # contents: only commits and trees are read (diffs compare trees)
+            if ref:
+                # Clone only the requested branch/tag
+                try:
+                    return git.Repo.clone_from(
+                        target,
+                        temp_dir,
+                        env=_CLONE_ENV,
+                        multi_options=[
+                            f"--branch={ref}",
+                            "--single-branch",
+                            "--filter=blob:none",
+                        ],
+                    )
+                except git.GitCommandError:
+                    # ref is not a branch/tag (e.g. a commit hash), fall back to all branches
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    temp_dir = tempfile.mkdtemp(prefix="git-storyteller-")
+                    return git.Repo.clone_from(
+                        target, temp_dir, env=_CLONE_ENV, multi_options=["--filter=blob:none"]
+                    )
+
+            # Default branch only
+            return git.Repo.clone_from(
+                target,
+                temp_dir,
+                env=_CLONE_ENV,
+                multi_options=["--filter=blob:none", "--single-branch", "--no-tags"],
+            )
         else:
-            return git.Repo(target)
+            repo = git.Repo(target)
+            if self.write_local_commit_graph:
+                self._ensure_commit_graph(repo)
+            return repo
+
+    def _get_cached_clone(self, url: str) -> git.Repo:
+        """Get an up-to-date clone of a remote's default branch from the clone cache.
+
+        A cached clone only downloads new objects; a missing or broken one is
+        replaced with a fresh clone.
+
+        Args:
+            url: Remote repository URL
+
+        Returns:
+            git.Repo object
+        """
+        url_key = hashlib.sha256(url.encode()).hexdigest()[:16]
+        # Keep the repository's own name as the directory name; it becomes impact.name
+        repo_name = url.rstrip("/").rsplit("/", 1)[-1].rsplit(":", 1)[-1].removesuffix(".git")
+        path = self.clone_cache_dir / url_key / (repo_name or "repo")
+
+        if (path / ".git").exists():
+            try:
+                repo = git.Repo(path)
+                with repo.git.custom_environment(**_CLONE_ENV):
+                    repo.git.fetch("--no-tags", "origin")
+                repo.git.reset("--hard", "@{upstream}")
+                self._ensure_commit_graph(repo)
+                return repo
+            except (git.GitCommandError, git.InvalidGitRepositoryError) as e:
+                print(f"⚠️  Recloning {url}: {e}")
+                shutil.rmtree(path, ignore_errors=True)
+
+        print(f"Cloning {url} to {path}...")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        repo = git.Repo.clone_from(
+            url,
+            path,
+            env=_CLONE_ENV,
+            multi_options=["--filter=blob:none", "--single-branch", "--no-tags"],
+        )
+        self._ensure_commit_graph(repo)
+        return repo
+
+    def _ensure_commit_graph(self, repo: git.Repo):
+        """Write a commit-graph for a repository if it is missing or stale.
+
+        The commit-graph lets git walk history without inflating every commit
+        object, which speeds up iter_commits and the total commit count. This
+        writes into the repository's object directory, so it runs for cached
+        clones, and for local repositories only with analysis.write_commit_graph
+        enabled. It is skipped when core.commitGraph is disabled or the object
+        directory is not writable. Graphs are split, so refreshing a stale one
+        only adds a layer for the new commits.
+
+        Args:
+            repo: Git repository object
+        """
+        if not repo.config_reader().get_value("core", "commitGraph", True):
+            return
+
+        info_dir = Path(repo.common_dir) / "objects" / "info"
+        if not os.access(info_dir, os.W_OK):
+            return
+
+        graph_files = (info_dir / "commit-graphs" / "commit-graph-chain", info_dir / "commit-graph")
+        head_log = Path(repo.common_dir) / "logs" / "HEAD"
+
+        for graph_file in graph_files:
+            if graph_file.exists():
+                if not head_log.exists() or graph_file.stat().st_mtime >= head_log.stat().st_mtime:
+                    return
+                break
+
+        try:
+            repo.git.commit_graph("write", "--reachable", "--split")
+        except git.GitCommandError:
+            # Older git versions; iter_commits still works
+            pass
 
     def _analyze_repo(self, repo: git.Repo, ref: Optional[str] = None) -> RepositoryImpact:
         """Analyze repository for marketing impact.
@@ -111,24 +357,29 @@ class GitAnalyzer:
         # Get recent commits
         if ref:
             try:
-                commits = list(repo.iter_commits(ref, max_count=10))
+                commits = list(repo.iter_commits(ref, max_count=RECENT_COMMITS))
             except Exception:
-                commits = list(repo.iter_commits(max_count=10))
+                commits = list(repo.iter_commits(max_count=RECENT_COMMITS))
         else:
-            commits = list(repo.iter_commits(max_count=10))
+            commits = list(repo.iter_commits(max_count=RECENT_COMMITS))
 
         # Analyze commits
         commit_infos = []
         for commit in commits:
+            message = commit.message.strip()
+            # Tree-to-tree diff against the parent: names only, no patch text or blobs
+            diff = commit.diff(commit.parents[0] if commit.parents else git.NULL_TREE)
             commit_info = CommitInfo(
                 hash=commit.hexsha[:8],
                 author=commit.author.name,
-                message=commit.message.strip(),
+                message=message,
                 date=commit.committed_datetime.isoformat(),
-                files_changed=[item.a_path for item in commit.diff()],
-                diff_summary=self._get_diff_summary(commit),
-                semantic_impact=self._analyze_semantic_impact(commit),
+                files_changed=[item.a_path for item in diff],
+                diff_summary=self._get_diff_summary(diff),
+                semantic_impact="",
             )
+            # Reuse the lowercased message CommitInfo already computed
+            commit_info.semantic_impact = self._analyze_semantic_impact(commit_info.message_lower)
             commit_infos.append(commit_info)
 
         # Generate marketing hooks
@@ -141,21 +392,21 @@ class GitAnalyzer:
             name=repo_name,
             description=self._get_repo_description(repo),
             recent_changes=commit_infos,
-            total_commits=sum(1 for _ in repo.iter_commits()),
+            # rev-list counts without parsing each commit object
+            total_commits=int(repo.git.rev_list("--count", "HEAD")),
             marketing_hooks=marketing_hooks,
             visual_highlights=visual_highlights,
         )
 
-    def _get_diff_summary(self, commit: git.Commit) -> str:
+    def _get_diff_summary(self, diff: git.DiffIndex) -> str:
         """Get a summary of the commit diff.
 
         Args:
-            commit: Git commit object
+            diff: Diff of the commit against its parent
 
         Returns:
             Diff summary string
         """
-        diff = commit.diff()
         if not diff:
             return "No changes"
 
@@ -165,17 +416,15 @@ class GitAnalyzer:
 
         return f"{files} file(s) changed, {additions} insertions(+), {deletions} deletions(-)"
 
-    def _analyze_semantic_impact(self, commit: git.Commit) -> str:
+    def _analyze_semantic_impact(self, message: str) -> str:
         """Analyze the semantic impact of a commit.
 
         Args:
-            commit: Git commit object
+            message: Stripped, lowercased commit message
 
         Returns:
             Semantic impact description
         """
-        message = commit.message.strip().lower()
-
         # Categorize commit type
         if any(word in message for word in ["fix", "bug", "patch"]):
             return "Bug fix - Improved stability and fixed issues"
@@ -250,70 +499,42 @@ class GitAnalyzer:
                     repo_ref = f"{username}/{repo_name}"
         # Extract actual, specific changes from commit messages
         recent = impact.recent_changes[:3]
-        real_changes = []
+        # Unique changes in first-seen order
+        seen = set()
+        unique_changes = []
 
         for commit in recent:
-            msg = commit.message.lower()
+            msg = commit.message_lower
 
             # Only extract REAL, specific functionality changes (not infrastructure/tooling)
-            if 'mcp' in msg:
-                real_changes.append("🔌 MCP integration")
-            elif 'browser' in msg or 'playwright' in msg:
-                real_changes.append("🎭 Browser automation")
-            elif 'visual' in msg or 'template' in msg:
-                real_changes.append("🎨 Visual rendering")
-            elif 'api' in msg:
-                real_changes.append("🌐 API endpoints")
-            elif 'auth' in msg:
-                real_changes.append("🔐 Authentication")
-            elif 'database' in msg or 'db' in msg:
-                real_changes.append("🗄️ Database layer")
-            elif 'ui' in msg or 'frontend' in msg:
-                real_changes.append("💄 UI improvements")
-            elif 'chat' in msg or 'message' in msg:
-                real_changes.append("💬 Chat features")
-            elif 'search' in msg:
-                real_changes.append("🔍 Search functionality")
-            elif 'export' in msg or 'download' in msg:
-                real_changes.append("📥 Export features")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_changes = []
-        for change in real_changes:
-            if change not in seen:
-                seen.add(change)
-                unique_changes.append(change)
-
-        # Build the tweet - eyecatching style
-        tweet_lines = []
+            for keywords, label in _CHANGE_MATCHERS:
+                if any(kw in msg for kw in keywords):
+                    if label not in seen:
+                        seen.add(label)
+                        unique_changes.append(label)
+                    break
 
         # Hook - make it punchy and eyecatching
         # Use repo_ref (username/repo) if available, otherwise fallback to impact.name
         repo_display = repo_ref if repo_ref else impact.name
 
         if impact.total_commits <= 10:
-            # New repo
-            tweet_lines.append(f"🚀 {repo_display} v1.0 is LIVE")
+            hook = _HOOK_NEW_REPO
         elif impact.total_commits <= 100:
-            # Growing repo
-            tweet_lines.append(f"🔥 {repo_display} keeps shipping")
+            hook = _HOOK_GROWING_REPO
         else:
-            # Established repo
-            tweet_lines.append(f"⚡ {repo_display} update")
-
-        tweet_lines.append("")
+            hook = _HOOK_ESTABLISHED_REPO
 
         # What's new - show summary of recent commits
+        summary = ""
         if unique_changes:
             # Show the changes we detected
-            changes_text = "Recent: " + ", ".join(unique_changes[:2])
-            tweet_lines.append(changes_text)
+            summary = "Recent: " + ", ".join(unique_changes[:2]) + "\n"
         elif len(recent) >= 1:
             # Extract topics from recent commit messages
             topics = set()
             for commit in recent[:3]:
-                msg = commit.message.lower()
+                msg = commit.message_lower
                 # Look for key topics
                 if 'fix' in msg:
                     topics.add('fixes')
@@ -327,30 +548,22 @@ class GitAnalyzer:
                     topics.add('improvements')
 
             if topics:
-                tweet_lines.append("Recent: " + ", ".join(sorted(topics)))
+                summary = "Recent: " + ", ".join(sorted(topics)) + "\n"
             else:
                 # Fallback to first commit message
                 msg = recent[0].message
                 for prefix in ['add:', 'fix:', 'feat:', 'chore:', 'docs:']:
                     msg = msg.replace(prefix, '', 1).strip()
-                tweet_lines.append(f"Latest: {msg[:60]}")
-
-        tweet_lines.append("")
-
-        # Hashtags - make them pop
-        tweet_lines.append("")
-        tweet_lines.append("👇")
+                summary = f"Latest: {msg[:60]}\n"
 
         # Add repo reference if provided (text format for better Twitter reach)
-        if repo_ref:
-            tweet_lines.append(f"GitHub: {repo_ref}")
-
-        # Add git-storyteller branding
-        tweet_lines.append("✨ Powered by theanthonyjin/git-storyteller")
+        github = f"GitHub: {repo_ref}\n" if repo_ref else ""
 
-        tweet_lines.append("#DevTools #AI #OpenSource")
-
-        return "\n".join(tweet_lines)
+        return _TWEET_TEMPLATE.format(
+            hook=hook.format(repo=repo_display),
+            summary=summary,
+            github=github,
+        )
 
     @staticmethod
     def get_last_tweeted_commit(history_file: Path = None) -> str:
@@ -385,6 +598,30 @@ class GitAnalyzer:
         with open(history_file, 'w') as f:
             f.write(commit_hash)
 
+    def resolve_head_sha(
+        self, target: str, ref: Optional[str] = None, is_remote: bool = False
+    ) -> Optional[str]:
+        """Resolve the commit a ref points to without cloning.
+
+        Remote targets are resolved with ``git ls-remote``; local targets are
+        read from the repository directly.
+
+        Args:
+            target: Local path or GitHub URL
+            ref: Optional branch or tag (default: HEAD)
+            is_remote: Whether target is a remote URL
+
+        Returns:
+            Full commit hash, or None if it could not be resolved
+        """
+        try:
+            if is_remote:
+                output = git.cmd.Git().ls_remote(target, ref or "HEAD")
+                return output.split("\t", 1)[0] if output else None
+            return git.Repo(target).commit(ref or "HEAD").hexsha
+        except (git.GitCommandError, git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+            return None
+
     def get_new_commits(self, repo: git.Repo, last_tweeted: str = None) -> list:
         """Get commits since the last tweeted one.
 
@@ -397,15 +634,15 @@ class GitAnalyzer:
         """
         if not last_tweeted:
             # No history, get recent commits
-            return list(repo.iter_commits(max_count=10))
+            return list(repo.iter_commits(max_count=RECENT_COMMITS))
 
-        # Get commits since last tweeted
+        # Get commits since last tweeted; past the limit the answer no longer changes
         commits = []
-        for commit in repo.iter_commits():
+        for commit in repo.iter_commits(max_count=RECENT_COMMITS):
             if commit.hexsha.startswith(last_tweeted):
                 break
             commits.append(commit)
-        return commits[:10]  # Limit to 10
+        return commits
 
     def _generate_visual_highlights(self, commits: List[CommitInfo]) -> List[str]:
         """Generate visual highlights for templates.
@@ -416,21 +653,21 @@ class GitAnalyzer:
         Returns:
             List of visual highlight strings
         """
+        if not commits:
+            return []
+
         highlights = []
 
         # Find files with most changes
-        file_counts = {}
-        for commit in commits:
-            for file_path in commit.files_changed:
-                file_counts[file_path] = file_counts.get(file_path, 0) + 1
+        file_counts = Counter(file_path for c in commits for file_path in c.files_changed)
 
         if file_counts:
-            top_file = max(file_counts, key=file_counts.get)
+            top_file, _ = file_counts.most_common(1)[0]
             highlights.append(f"Most active file: {top_file}")
 
         # Check for significant commits
         for commit in commits[:3]:
-            if any(word in commit.message.lower() for word in ["major", "breaking", "rewrite"]):
+            if any(word in commit.message_lower for word in ["major", "breaking", "rewrite"]):
                 highlights.append(f"🔥 Breaking change: {commit.message[:50]}...")
                 break
 
@@ -1,28 +1,34 @@
 """Feedback learning system for optimizing content generation."""
-import json
+import heapq
+import mmap
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
+
 from ..config import get_config
+from ..utils.files import atomic_write_bytes
 
 
+@dataclass(slots=True)
 class EngagementMetrics:
-    """Engagement metrics for a post."""
+    """Engagement metrics for a post.
 
-    def __init__(self, likes: int = 0, retweets: int = 0, replies: int = 0, views: int = 0):
-        """Initialize engagement metrics.
+    Attributes:
+        likes: Number of likes
+        retweets: Number of retweets/shares
+        replies: Number of replies/comments
+        views: Number of views/impressions
+    """
 
-        Args:
-            likes: Number of likes
-            retweets: Number of retweets/shares
-            replies: Number of replies/comments
-            views: Number of views/impressions
-        """
-        self.likes = likes
-        self.retweets = retweets
-        self.replies = replies
-        self.views = views
+    likes: int = 0
+    retweets: int = 0
+    replies: int = 0
+    views: int = 0
 
     @property
     def total_engagement(self) -> int:
@@ -77,37 +83,35 @@ class EngagementMetrics:
         )
 
 
+@dataclass(slots=True)
 class PostRecord:
-    """Record of a social media post."""
-
-    def __init__(
-        self,
-        post_id: str,
-        platform: str,
-        content: str,
-        hook_type: str,
-        template: str,
-        timestamp: str,
-        metrics: Optional[EngagementMetrics] = None,
-    ):
-        """Initialize post record.
-
-        Args:
-            post_id: Unique post identifier
-            platform: Platform posted to (twitter, linkedin)
-            content: Post content
-            hook_type: Type of hook used (e.g., "feature", "bug_fix", "milestone")
-            template: Template used (carbon_x, bento_metrics)
-            timestamp: ISO timestamp of post
-            metrics: Optional engagement metrics
-        """
-        self.post_id = post_id
-        self.platform = platform
-        self.content = content
-        self.hook_type = hook_type
-        self.template = template
-        self.timestamp = timestamp
-        self.metrics = metrics or EngagementMetrics()
+    """Record of a social media post.
+
+    Attributes:
+        post_id: Unique post identifier
+        platform: Platform posted to (twitter, linkedin)
+        content: Post content
+        hook_type: Type of hook used (e.g., "feature", "bug_fix", "milestone")
+        template: Template used (carbon_x, bento_metrics)
+        timestamp: ISO timestamp of post
+        metrics: Optional engagement metrics
+    """
+
+    post_id: str
+    platform: str
+    content: str
+    hook_type: str
+    template: str
+    timestamp: str
+    metrics: Optional[EngagementMetrics] = None
+
+    def __post_init__(self):
+        """Intern categorical fields and default the metrics."""
+        self.platform = sys.intern(self.platform)
+        self.hook_type = sys.intern(self.hook_type)
+        self.template = sys.intern(self.template)
+        if self.metrics is None:
+            self.metrics = EngagementMetrics()
 
     def to_dict(self) -> dict:
         """Convert to dictionary.
@@ -146,14 +150,81 @@ class PostRecord:
         )
 
 
+def _post_engagement(post: dict) -> int:
+    """Get the total engagement denormalized onto a post dictionary.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Total engagement score
+    """
+    return post.get("engagement", 0)
+
+
+def _intern_categories(post: dict):
+    """Intern the repeated categorical strings of a post dictionary in place.
+
+    Args:
+        post: Post dictionary
+    """
+    post["platform"] = sys.intern(post["platform"])
+    post["hook_type"] = sys.intern(post["hook_type"])
+    post["template"] = sys.intern(post["template"])
+
+
+# Journal entries to accumulate before folding them into the snapshot file
+COMPACT_THRESHOLD = 100
+
+# Number of highest-engagement posts tracked incrementally
+TOP_POSTS_TRACKED = 10
+
+
 class LearningSystem:
-    """Learning system for optimizing content generation."""
+    """Learning system for optimizing content generation.
+
+    Learning data lives in a JSON snapshot (``learning.feedback_file``) plus an
+    append-only JSONL journal next to it. New posts and metric updates are
+    appended to the journal and folded into the snapshot by ``compact()``.
+    """
 
     def __init__(self):
         """Initialize the learning system."""
         self.config = get_config()
         self.learning_file = Path(self.config.get("learning.feedback_file")).expanduser()
-        self.data = self._load_learning_data()
+        self.journal_file = self.learning_file.with_suffix(".jsonl")
+        self._journal_entries = 0
+        self._hook_totals: dict = {}
+        self._template_totals: dict = {}
+        self._total_engagement = 0
+        self._posts_by_id: dict = {}
+        self._post_positions: dict = {}
+        # Min-heap of (engagement, -position) for the top TOP_POSTS_TRACKED posts
+        self._top_heap: list = []
+        # (best hook type, best template), recomputed lazily after stats change
+        self._best: Optional[tuple] = None
+        self._data: Optional[dict] = None
+
+    @property
+    def data(self) -> dict:
+        """Learning data, loaded from disk on first access.
+
+        Returns:
+            Learning data dictionary
+        """
+        if self._data is None:
+            self._ensure_loaded()
+        return self._data
+
+    def _ensure_loaded(self):
+        """Load the snapshot, replay the journal and build indexes if not done yet."""
+        if self._data is not None:
+            return
+
+        self._data = self._load_learning_data()
+        self._index_posts()
+        self._replay_journal()
+        self._update_performance_stats()
 
     def _load_learning_data(self) -> dict:
         """Load learning data from file.
@@ -161,29 +232,137 @@ class LearningSystem:
         Returns:
             Learning data dictionary
         """
+        data = {
+            "posts": [],
+            "hook_performance": {},
+            "template_performance": {},
+            "best_practices": [],
+            "amplifications": [],
+            "last_updated": None,
+        }
+
         if not self.learning_file.exists():
-            return {
-                "posts": [],
-                "hook_performance": {},
-                "template_performance": {},
-                "best_practices": [],
-                "last_updated": None,
-            }
+            return data
 
         try:
-            with open(self.learning_file, "r") as f:
-                return json.load(f)
+            # Parse straight from the page cache instead of copying the file into memory
+            with (
+                open(self.learning_file, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                memoryview(mm) as view,
+            ):
+                data.update(orjson.loads(view))
         except Exception as e:
             print(f"Warning: Could not load learning data: {e}")
-            return {}
+
+        return data
+
+    def _index_posts(self):
+        """Build the post_id -> post index and backfill denormalized fields."""
+        self._posts_by_id = {}
+        self._post_positions = {}
+        for idx, post in enumerate(self.data["posts"]):
+            _intern_categories(post)
+            self._posts_by_id[post["post_id"]] = post
+            self._post_positions[post["post_id"]] = idx
+            if "engagement" not in post:
+                post["engagement"] = post.get("metrics", {}).get("total_engagement", 0)
+            if "ts_epoch" not in post:
+                try:
+                    post["ts_epoch"] = datetime.fromisoformat(post["timestamp"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    # Missing or malformed timestamp: never counts as recent
+                    post["ts_epoch"] = 0
+
+    def _replay_journal(self):
+        """Apply journal entries written since the last snapshot."""
+        if not self.journal_file.exists() or self.journal_file.stat().st_size == 0:
+            return
+
+        # An interrupted compact() leaves the journal next to a snapshot that already
+        # contains its amplifications, so replay skips those like it skips known posts
+        seen_amplifications = {
+            (a["post_id"], a["platform"], a["timestamp"]) for a in self.data["amplifications"]
+        }
+
+        with (
+            open(self.journal_file, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            for line in iter(mm.readline, b""):
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Torn final line from an interrupted append
+                    continue
+
+                self._journal_entries += 1
+
+                if entry["event"] == "post":
+                    post = entry["post"]
+                    # Skip posts already folded into the snapshot by an interrupted compact()
+                    if post["post_id"] not in self._posts_by_id:
+                        _intern_categories(post)
+                        self._posts_by_id[post["post_id"]] = post
+                        self._post_positions[post["post_id"]] = len(self.data["posts"])
+                        self.data["posts"].append(post)
+                elif entry["event"] == "metrics":
+                    post = self._posts_by_id.get(entry["post_id"])
+                    if post:
+                        post["metrics"] = entry["metrics"]
+                        post["engagement"] = entry["metrics"].get("total_engagement", 0)
+                elif entry["event"] == "amplification":
+                    amplification = entry["amplification"]
+                    key = (
+                        amplification["post_id"],
+                        amplification["platform"],
+                        amplification["timestamp"],
+                    )
+                    if key not in seen_amplifications:
+                        seen_amplifications.add(key)
+                        self.data["amplifications"].append(amplification)
+
+    def _append_journal(self, entry: dict):
+        """Append an entry to the journal, compacting when it grows too long.
+
+        Args:
+            entry: Journal entry ("post", "metrics" or "amplification" event)
+        """
+        self._append_journal_batch([entry])
+
+    def _append_journal_batch(self, entries: List[dict]):
+        """Append several entries to the journal with a single write.
+
+        Args:
+            entries: Journal entries
+        """
+        self.learning_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+        with open(self.journal_file, "ab+") as f:
+            # Start a fresh line after a torn one left by an interrupted append,
+            # otherwise the first new entry would be lost with it on replay
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+
+        self._journal_entries += len(entries)
+        if self._journal_entries >= COMPACT_THRESHOLD:
+            self.compact()
 
     def _save_learning_data(self):
         """Save learning data to file."""
-        self.learning_file.parent.mkdir(parents=True, exist_ok=True)
         self.data["last_updated"] = datetime.now().isoformat()
 
-        with open(self.learning_file, "w") as f:
-            json.dump(self.data, f, indent=2)
+        atomic_write_bytes(self.learning_file, orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+
+    def compact(self):
+        """Fold the journal into the snapshot file and truncate the journal."""
+        self._save_learning_data()
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_entries = 0
 
     def record_post(
         self,
@@ -205,7 +384,9 @@ class LearningSystem:
         Returns:
             PostRecord instance
         """
-        timestamp = datetime.now().isoformat()
+        self._ensure_loaded()
+        now = datetime.now()
+        timestamp = now.isoformat()
         record = PostRecord(
             post_id=post_id,
             platform=platform,
@@ -215,8 +396,15 @@ class LearningSystem:
             timestamp=timestamp,
         )
 
-        self.data["posts"].append(record.to_dict())
-        self._save_learning_data()
+        post = record.to_dict()
+        post["engagement"] = record.metrics.total_engagement
+        post["ts_epoch"] = now.timestamp()
+        self._post_positions[post_id] = len(self.data["posts"])
+        self.data["posts"].append(post)
+        self._posts_by_id[post_id] = post
+        self._apply_to_stats(post, 1)
+        self._track_top_post(post_id)
+        self._append_journal({"event": "post", "post": post})
 
         return record
 
@@ -227,59 +415,176 @@ class LearningSystem:
             post_id: Post identifier
             metrics: New engagement metrics
         """
-        for post in self.data["posts"]:
-            if post["post_id"] == post_id:
-                post["metrics"] = metrics.to_dict()
-                self._update_performance_stats()
-                self._save_learning_data()
-                return
+        self._ensure_loaded()
+        post = self._posts_by_id.get(post_id)
+        if not post:
+            print(f"Warning: Post {post_id} not found")
+            return
+
+        self._apply_to_stats(post, -1)
+        post["metrics"] = metrics.to_dict()
+        post["engagement"] = post["metrics"]["total_engagement"]
+        self._apply_to_stats(post, 1)
+        self._track_top_post(post_id)
+        self._append_journal({"event": "metrics", "post_id": post_id, "metrics": post["metrics"]})
+
+    def record_amplifications(self, amplifications: List[dict]):
+        """Record a batch of amplification replies.
 
-        print(f"Warning: Post {post_id} not found")
+        Args:
+            amplifications: Amplification dicts (post_id, platform, content, timestamp)
+        """
+        if not amplifications:
+            return
 
-    def _update_performance_stats(self):
-        """Update performance statistics."""
-        # Calculate hook performance
-        hook_stats = {}
-        for post in self.data["posts"]:
-            hook = post["hook_type"]
-            if hook not in hook_stats:
-                hook_stats[hook] = {"total_engagement": 0, "count": 0}
-
-            metrics = post.get("metrics", {})
-            total = metrics.get("total_engagement", 0)
-            hook_stats[hook]["total_engagement"] += total
-            hook_stats[hook]["count"] += 1
-
-        # Calculate averages
-        self.data["hook_performance"] = {}
-        for hook, stats in hook_stats.items():
-            if stats["count"] > 0:
-                avg = stats["total_engagement"] / stats["count"]
-                self.data["hook_performance"][hook] = {
-                    "avg_engagement": avg,
-                    "post_count": stats["count"],
+        self._ensure_loaded()
+        self.data["amplifications"].extend(amplifications)
+        self._append_journal_batch(
+            [{"event": "amplification", "amplification": a} for a in amplifications]
+        )
+
+    def _apply_to_stats(self, post: dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) a post from the running performance stats.
+
+        Args:
+            post: Post dictionary
+            sign: 1 to add the post, -1 to remove it
+        """
+        total = _post_engagement(post)
+        self._total_engagement += sign * total
+        self._best = None
+
+        for totals, performance, key in (
+            (self._hook_totals, self.data["hook_performance"], post["hook_type"]),
+            (self._template_totals, self.data["template_performance"], post["template"]),
+        ):
+            stats = totals.setdefault(key, [0, 0])
+            stats[0] += sign * total
+            stats[1] += sign
+
+            if stats[1] > 0:
+                performance[key] = {
+                    "avg_engagement": stats[0] / stats[1],
+                    "post_count": stats[1],
                 }
+            else:
+                del totals[key]
+                performance.pop(key, None)
+
+    def _update_performance_stats(self):
+        """Rebuild performance statistics from all posts."""
+        hook_totals = {}
+        template_totals = {}
+        total_engagement = 0
 
-        # Calculate template performance
-        template_stats = {}
+        # Accumulate raw sums first and derive averages once per key afterwards
         for post in self.data["posts"]:
-            template = post["template"]
-            if template not in template_stats:
-                template_stats[template] = {"total_engagement": 0, "count": 0}
-
-            metrics = post.get("metrics", {})
-            total = metrics.get("total_engagement", 0)
-            template_stats[template]["total_engagement"] += total
-            template_stats[template]["count"] += 1
-
-        self.data["template_performance"] = {}
-        for template, stats in template_stats.items():
-            if stats["count"] > 0:
-                avg = stats["total_engagement"] / stats["count"]
-                self.data["template_performance"][template] = {
-                    "avg_engagement": avg,
-                    "post_count": stats["count"],
-                }
+            engagement = _post_engagement(post)
+            total_engagement += engagement
+
+            stats = hook_totals.get(post["hook_type"])
+            if stats is None:
+                hook_totals[post["hook_type"]] = [engagement, 1]
+            else:
+                stats[0] += engagement
+                stats[1] += 1
+
+            stats = template_totals.get(post["template"])
+            if stats is None:
+                template_totals[post["template"]] = [engagement, 1]
+            else:
+                stats[0] += engagement
+                stats[1] += 1
+
+        self._hook_totals = hook_totals
+        self._template_totals = template_totals
+        self._total_engagement = total_engagement
+        self.data["hook_performance"] = {
+            hook: {"avg_engagement": total / count, "post_count": count}
+            for hook, (total, count) in hook_totals.items()
+        }
+        self.data["template_performance"] = {
+            template: {"avg_engagement": total / count, "post_count": count}
+            for template, (total, count) in template_totals.items()
+        }
+        self._best = None
+        self._rebuild_top_posts()
+
+    def _rebuild_top_posts(self):
+        """Rebuild the heap of highest-engagement posts from all posts."""
+        self._top_heap = heapq.nlargest(
+            TOP_POSTS_TRACKED,
+            ((_post_engagement(post), -idx) for idx, post in enumerate(self.data["posts"])),
+        )
+        heapq.heapify(self._top_heap)
+
+    def _track_top_post(self, post_id: str):
+        """Update the top posts heap after a post was added or its engagement changed.
+
+        Args:
+            post_id: Post identifier
+        """
+        idx = self._post_positions[post_id]
+        entry = (_post_engagement(self.data["posts"][idx]), -idx)
+
+        for i, (engagement, neg_idx) in enumerate(self._top_heap):
+            if neg_idx == -idx:
+                if entry[0] < engagement:
+                    # A tracked post dropped, so an untracked one may now outrank it
+                    self._rebuild_top_posts()
+                else:
+                    self._top_heap[i] = entry
+                    heapq.heapify(self._top_heap)
+                return
+
+        if len(self._top_heap) < TOP_POSTS_TRACKED:
+            heapq.heappush(self._top_heap, entry)
+        elif entry > self._top_heap[0]:
+            heapq.heapreplace(self._top_heap, entry)
+
+    def _top_posts(self, limit: int) -> List[dict]:
+        """Get the highest-engagement posts, best first.
+
+        Ties are broken in favour of the earlier post.
+
+        Args:
+            limit: Maximum number of posts
+
+        Returns:
+            List of post dictionaries
+        """
+        posts = self.data["posts"]
+        if limit > TOP_POSTS_TRACKED:
+            return heapq.nlargest(limit, posts, key=_post_engagement)
+        return [posts[-neg_idx] for _, neg_idx in heapq.nlargest(limit, self._top_heap)]
+
+    @staticmethod
+    def _best_performer(performance: dict) -> Optional[str]:
+        """Get the key with the highest average engagement.
+
+        Args:
+            performance: Performance dictionary (hook or template)
+
+        Returns:
+            Best performing key or None
+        """
+        if not performance:
+            return None
+
+        return max(performance.items(), key=lambda x: x[1]["avg_engagement"])[0]
+
+    def _get_best(self) -> tuple:
+        """Get the cached (best hook type, best template) pair.
+
+        Returns:
+            Tuple of best hook type and best template
+        """
+        if self._best is None:
+            self._best = (
+                self._best_performer(self.data["hook_performance"]),
+                self._best_performer(self.data["template_performance"]),
+            )
+        return self._best
 
     def get_best_hook_type(self) -> Optional[str]:
         """Get the best performing hook type.
@@ -287,13 +592,7 @@ class LearningSystem:
         Returns:
             Best hook type or None
         """
-        if not self.data["hook_performance"]:
-            return None
-
-        return max(
-            self.data["hook_performance"].items(),
-            key=lambda x: x[1]["avg_engagement"],
-        )[0]
+        return self._get_best()[0]
 
     def get_best_template(self) -> Optional[str]:
         """Get the best performing template.
@@ -301,13 +600,7 @@ class LearningSystem:
         Returns:
             Best template or None
         """
-        if not self.data["template_performance"]:
-            return None
-
-        return max(
-            self.data["template_performance"].items(),
-            key=lambda x: x[1]["avg_engagement"],
-        )[0]
+        return self._get_best()[1]
 
     def get_hook_suggestions(self, limit: int = 5) -> List[str]:
         """Get hook suggestions based on performance.
@@ -319,14 +612,10 @@ class LearningSystem:
             List of hook suggestions
         """
         # Find posts with highest engagement
-        sorted_posts = sorted(
-            self.data["posts"],
-            key=lambda p: p.get("metrics", {}).get("total_engagement", 0),
-            reverse=True,
-        )
+        top_posts = self._top_posts(limit)
 
         suggestions = []
-        for post in sorted_posts[:limit]:
+        for post in top_posts:
             content = post.get("content", "")
             # Extract hook (first line or first sentence)
             lines = content.split("\n")
@@ -344,25 +633,26 @@ class LearningSystem:
         Returns:
             Optimized prompt
         """
+        parts = [base_prompt]
+
         # Add best practices to prompt
         best_hooks = self.get_hook_suggestions(3)
 
         if best_hooks:
-            base_prompt += "\n\nHere are some high-performing hook examples:\n"
-            for i, hook in enumerate(best_hooks, 1):
-                base_prompt += f"{i}. {hook}\n"
+            parts.append("\n\nHere are some high-performing hook examples:\n")
+            parts.extend(f"{i}. {hook}\n" for i, hook in enumerate(best_hooks, 1))
 
         # Suggest best template
         best_template = self.get_best_template()
         if best_template:
-            base_prompt += f"\nRecommended template: {best_template} (based on historical performance)\n"
+            parts.append(f"\nRecommended template: {best_template} (based on historical performance)\n")
 
         # Suggest best hook type
         best_hook = self.get_best_hook_type()
         if best_hook:
-            base_prompt += f"Recommended hook type: {best_hook} (based on historical performance)\n"
+            parts.append(f"Recommended hook type: {best_hook} (based on historical performance)\n")
 
-        return base_prompt
+        return "".join(parts)
 
     def get_recent_posts(self, days: int = 7) -> List[PostRecord]:
         """Get posts from the last N days.
@@ -373,15 +663,13 @@ class LearningSystem:
         Returns:
             List of recent posts
         """
-        cutoff = datetime.now() - timedelta(days=days)
-
-        recent = []
-        for post_data in self.data["posts"]:
-            timestamp = datetime.fromisoformat(post_data["timestamp"])
-            if timestamp >= cutoff:
-                recent.append(PostRecord.from_dict(post_data))
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
 
-        return recent
+        return [
+            PostRecord.from_dict(post_data)
+            for post_data in self.data["posts"]
+            if post_data.get("ts_epoch", 0) >= cutoff
+        ]
 
     def get_insights(self) -> dict:
         """Get insights from learning data.
@@ -393,21 +681,14 @@ class LearningSystem:
         if total_posts == 0:
             return {"message": "No data yet. Start posting to gather insights!"}
 
-        # Calculate total engagement
-        total_engagement = sum(
-            p.get("metrics", {}).get("total_engagement", 0) for p in self.data["posts"]
-        )
+        total_engagement = self._total_engagement
+
+        # Best performing posts
+        top_posts = self._top_posts(3)
 
         # Average engagement
         avg_engagement = total_engagement / total_posts if total_posts > 0 else 0
 
-        # Best performing posts
-        top_posts = sorted(
-            self.data["posts"],
-            key=lambda p: p.get("metrics", {}).get("total_engagement", 0),
-            reverse=True,
-        )[:3]
-
         return {
             "total_posts": total_posts,
             "total_engagement": total_engagement,
@@ -417,7 +698,7 @@ class LearningSystem:
             "hook_performance": self.data.get("hook_performance", {}),
             "template_performance": self.data.get("template_performance", {}),
             "top_posts": [
-                {"content": p["content"][:100], "engagement": p.get("metrics", {}).get("total_engagement", 0)}
+                {"content": p["content"][:100], "engagement": _post_engagement(p)}
                 for p in top_posts
             ],
         }
@@ -428,7 +709,7 @@ class LearningSystem:
         Returns:
             JSON string of learning data
         """
-        return json.dumps(self.data, indent=2)
+        return orjson.dumps(self.data, option=orjson.OPT_INDENT_2).decode()
 
     def import_learning_data(self, data: str):
         """Import learning data from JSON string.
@@ -436,5 +717,8 @@ class LearningSystem:
         Args:
             data: JSON string
         """
-        self.data = json.loads(data)
-        self._save_learning_data()
+        self._data = orjson.loads(data)
+        self._data.setdefault("amplifications", [])
+        self._index_posts()
+        self._update_performance_stats()
+        self.compact()
@@ -1,22 +1,60 @@
 """MCP server implementation for git-storyteller."""
-import json
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastmcp import FastMCP
 
 from ..config import get_config
+from ..utils.files import atomic_write_bytes
 from .browser_automation import BrowserAutomation
-from .git_analyzer import GitAnalyzer
+from .git_analyzer import GitAnalyzer, RepositoryImpact
 from .visual_engine import VisualEngine
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared browsers when the server shuts down.
+
+    Args:
+        server: The MCP server
+    """
+    global browser_automation
+    try:
+        yield
+    finally:
+        try:
+            await visual_engine.close()
+            if browser_automation is not None:
+                await browser_automation.close()
+                browser_automation = None
+        except Exception as e:
+            # stdout carries the MCP protocol
+            print(f"⚠️  Could not close browsers: {e}", file=sys.stderr)
+
+
 # Create MCP server
-mcp = FastMCP(name="git-storyteller")
+mcp = FastMCP(name="git-storyteller", lifespan=_lifespan)
+
+# Targets starting with these are cloned instead of opened locally
+_REMOTE_PREFIXES = ("http://", "https://", "git@github.com:")
+
+# Platform name -> BrowserAutomation posting method
+_POSTERS = {
+    "twitter": BrowserAutomation.post_to_twitter,
+    "linkedin": BrowserAutomation.post_to_linkedin,
+}
 
 # Initialize components
 git_analyzer = GitAnalyzer()
 visual_engine = VisualEngine()
 browser_automation: Optional[BrowserAutomation] = None
+# Guards start-up of the shared browser
+_browser_lock = asyncio.Lock()
 
 
 def get_browser() -> BrowserAutomation:
@@ -31,16 +69,66 @@ def get_browser() -> BrowserAutomation:
     return browser_automation
 
 
+async def _ensure_browser() -> BrowserAutomation:
+    """Get the shared browser automation instance, launching it on first use.
+
+    Returns:
+        Initialized BrowserAutomation instance
+    """
+    browser = get_browser()
+    async with _browser_lock:
+        if browser.browser is None:
+            await browser.initialize()
+    return browser
+
+
+@lru_cache(maxsize=32)
+def _analyze_at(target: str, ref: Optional[str], is_remote: bool, head_sha: str) -> RepositoryImpact:
+    """Analyze a repository, memoized on the commit its ref resolves to.
+
+    Args:
+        target: Local repository path or GitHub URL
+        ref: Optional commit hash, branch, or PR reference
+        is_remote: Whether target is a remote URL
+        head_sha: Commit the ref currently points to (cache key only)
+
+    Returns:
+        RepositoryImpact analysis
+    """
+    return git_analyzer.analyze(target, ref=ref, is_remote=is_remote)
+
+
+def _analyze_memoized(
+    target: str, ref: Optional[str] = None, is_remote: bool = False
+) -> RepositoryImpact:
+    """Analyze a repository, reusing the previous result if its head has not moved.
+
+    Args:
+        target: Local repository path or GitHub URL
+        ref: Optional commit hash, branch, or PR reference
+        is_remote: Whether target is a remote URL
+
+    Returns:
+        RepositoryImpact analysis
+    """
+    head_sha = git_analyzer.resolve_head_sha(target, ref=ref, is_remote=is_remote)
+    if head_sha is None:
+        return git_analyzer.analyze(target, ref=ref, is_remote=is_remote)
+    return _analyze_at(target, ref, is_remote, head_sha)
+
+
 @mcp.tool()
 async def analyze_repository_impact(
     target: str,
     ref: Optional[str] = None,
+    refresh: bool = False,
 ) -> dict:
     """Analyze local or remote repository for marketing value.
 
     Args:
         target: Local repository path or GitHub URL
         ref: Optional commit hash, branch, or PR reference
+        refresh: Drop cached analyses and re-analyze from scratch
 
     Returns:
         Dictionary with repository analysis including:
@@ -52,11 +140,14 @@ async def analyze_repository_impact(
         - visual_highlights: List of visual highlight strings
     """
     # Determine if target is a remote URL
-    is_remote = target.startswith(("http://", "https://", "git@github.com:"))
+    is_remote = target.startswith(_REMOTE_PREFIXES)
 
     try:
+        if refresh:
+            _analyze_at.cache_clear()
+
         # Analyze repository
-        impact = git_analyzer.analyze(target, ref=ref, is_remote=is_remote)
+        impact = _analyze_memoized(target, ref=ref, is_remote=is_remote)
 
         return {
             "name": impact.name,
@@ -108,16 +199,20 @@ async def summarize_milestone_impact(
     """
     try:
         # Analyze repository
-        is_remote = target.startswith(("http://", "https://", "git@github.com:"))
-        impact = git_analyzer.analyze(target, ref=None, is_remote=is_remote)
+        is_remote = target.startswith(_REMOTE_PREFIXES)
+        impact = _analyze_memoized(target, ref=None, is_remote=is_remote)
 
         # Calculate milestone metrics
         commit_count = len(impact.recent_changes)
-        impact_types = [c.semantic_impact for c in impact.recent_changes]
 
         # Generate impact summary
-        feat_count = sum(1 for t in impact_types if "feature" in t.lower())
-        fix_count = sum(1 for t in impact_types if "bug fix" in t.lower())
+        feat_count = fix_count = 0
+        for c in impact.recent_changes:
+            impact_type = c.semantic_impact.lower()
+            if "feature" in impact_type:
+                feat_count += 1
+            if "bug fix" in impact_type:
+                fix_count += 1
 
         impact_summary = f"Made {commit_count} commits"
         if feat_count > 0:
@@ -129,12 +224,13 @@ async def summarize_milestone_impact(
         top_changes = impact.recent_changes[:3]
 
         # Generate suggested caption
-        caption = f"🚀 Just pushed {commit_count} commits to {impact.name}!\n\n"
-        caption += f"{impact_summary}\n\n"
-        caption += "Highlights:\n"
-        for hook in impact.marketing_hooks[:3]:
-            caption += f"• {hook}\n"
-        caption += "\n#coding #devlife"
+        caption = "".join([
+            f"🚀 Just pushed {commit_count} commits to {impact.name}!\n\n",
+            f"{impact_summary}\n\n",
+            "Highlights:\n",
+            *(f"• {hook}\n" for hook in impact.marketing_hooks[:3]),
+            "\n#coding #devlife",
+        ])
 
         return {
             "commit_count": commit_count,
@@ -238,31 +334,53 @@ async def stealth_browser_dispatcher(
         - post_url: URL of posted content (if available)
     """
     try:
-        # Initialize browser if needed
-        browser = get_browser()
-        await browser.initialize()
+        browser = await _ensure_browser()
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to dispatch post: {str(e)}",
+            "platform": platform,
+        }
+    return await _dispatch_post(browser.tab(), platform, text, image_path, scheduled_at)
+
+
+async def _dispatch_post(
+    browser: BrowserAutomation,
+    platform: str,
+    text: str,
+    image_path: Optional[str] = None,
+    scheduled_at: Optional[str] = None,
+) -> dict:
+    """Post to a platform through the given browser automation instance.
+
+    Args:
+        browser: Initialized BrowserAutomation instance to post with
+        platform: Platform to post to ("twitter" or "linkedin")
+        text: Post content/text
+        image_path: Optional path to image to attach
+        scheduled_at: Optional schedule time in HH:MM format (e.g., "09:00")
+
+    Returns:
+        Dispatch result dictionary (see stealth_browser_dispatcher)
+    """
+    poster = _POSTERS.get(platform)
+    if poster is None:
+        return {
+            "success": False,
+            "error": f"Unsupported platform: {platform}",
+        }
 
+    try:
         # Wait for scheduled time if specified
         if scheduled_at:
             await browser.wait_for_scheduled_time(scheduled_at)
 
         # Post to appropriate platform
-        if platform == "twitter":
-            success = await browser.post_to_twitter(
-                text=text,
-                image_path=Path(image_path) if image_path else None,
-                scheduled_at=scheduled_at,
-            )
-        elif platform == "linkedin":
-            success = await browser.post_to_linkedin(
-                text=text,
-                image_path=Path(image_path) if image_path else None,
-            )
-        else:
-            return {
-                "success": False,
-                "error": f"Unsupported platform: {platform}",
-            }
+        success = await poster(
+            browser,
+            text=text,
+            image_path=Path(image_path) if image_path else None,
+        )
 
         return {
             "success": success,
@@ -278,6 +396,30 @@ async def stealth_browser_dispatcher(
         }
 
 
+def _read_json_file(path: Path) -> dict:
+    """Read a JSON file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Parsed data, or an empty dict if the file does not exist
+    """
+    if not path.exists():
+        return {}
+    return orjson.loads(path.read_bytes())
+
+
+def _write_json_file(path: Path, data: dict):
+    """Atomically write data to a JSON file, creating parent directories as needed.
+
+    Args:
+        path: File to write
+        data: Data to serialize
+    """
+    atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
 @mcp.tool()
 async def fetch_engagement_feedback(platform: str, limit: int = 5) -> dict:
     """Fetch engagement metrics from recent posts.
@@ -300,8 +442,7 @@ async def fetch_engagement_feedback(platform: str, limit: int = 5) -> dict:
 
     try:
         # Initialize browser if needed
-        browser = get_browser()
-        await browser.initialize()
+        browser = await _ensure_browser()
 
         # Fetch metrics
         metrics = await browser.fetch_engagement_metrics(platform)
@@ -318,20 +459,16 @@ async def fetch_engagement_feedback(platform: str, limit: int = 5) -> dict:
 
         # Save to learning file
         learning_file = Path(config.get("learning.feedback_file", "~/.config/git-storyteller/learning.json")).expanduser()
-        learning_file.parent.mkdir(parents=True, exist_ok=True)
 
-        learning_data = {}
-        if learning_file.exists():
-            with open(learning_file) as f:
-                learning_data = json.load(f)
+        # File I/O runs in a worker thread so other tool calls keep being served
+        learning_data = await asyncio.to_thread(_read_json_file, learning_file)
 
         learning_data[platform] = learning_data.get(platform, {})
         learning_data[platform]["recent_metrics"] = metrics
         learning_data[platform]["total_engagement"] = total_engagement
         learning_data[platform]["learnings"] = learnings
 
-        with open(learning_file, "w") as f:
-            json.dump(learning_data, f, indent=2)
+        await asyncio.to_thread(_write_json_file, learning_file, learning_data)
 
         return {
             "platform": platform,
@@ -434,18 +571,24 @@ async def autonomous_storyteller_workflow(
         results["steps"].append({"step": "Generating visual asset...", "status": "completed", "image": image_path})
 
         # Step 3: Post to platforms
-        for platform in platforms:
-            results["steps"].append({"step": f"Posting to {platform}...", "status": "running"})
-
-            # Generate caption
-            caption = f"🚀 Just pushed updates to {analysis['name']}!\n\n"
-            caption += "\n".join(analysis["marketing_hooks"][:3])
-
-            post_result = await stealth_browser_dispatcher(
-                platform=platform,
-                text=caption,
-                image_path=image_path,
-            )
+        caption = f"🚀 Just pushed updates to {analysis['name']}!\n\n" + "\n".join(
+            analysis["marketing_hooks"][:3]
+        )
+
+        # Post to all platforms concurrently, each on its own page of the
+        # shared, logged-in browser
+        browser = await _ensure_browser()
+        post_results = await asyncio.gather(
+            *(
+                _dispatch_post(browser.tab(), platform, caption, image_path)
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+
+        for platform, post_result in zip(platforms, post_results):
+            if isinstance(post_result, Exception):
+                post_result = {"success": False, "error": str(post_result), "platform": platform}
 
             results["steps"].append({
                 "step": f"Posting to {platform}...",
@@ -4,10 +4,44 @@ import random
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from ..config import get_config
 from .browser_automation import BrowserAutomation
 from .learning_system import LearningSystem
 
+# Keyword groups checked in order by AmplificationStrategy.select_reply_type
+_REPLY_TYPE_MATCHERS = (
+    (("feature", "launched", "released"), "teaser"),
+    (("how", "tutorial", "guide"), "insight"),
+    (("problem", "issue", "bug"), "question"),
+)
+
+# Reply openers by reply type, used by SelfHypeAmplifier._generate_reply
+_REPLY_TEMPLATES = {
+    "insight": (
+        "🧵 Here's a deeper dive into the technical details...\n\n",
+        "💡 The key insight behind this change is...\n\n",
+        "🔬 Technical breakdown:\n\n",
+    ),
+    "question": (
+        "❓ What do you think about this approach?\n\n",
+        "🤔 Has anyone faced similar challenges?\n\n",
+        "💬 Would love to hear your thoughts on this!\n\n",
+    ),
+    "teaser": (
+        "🔥 Bonus: Here's what I didn't mention in the original post...\n\n",
+        "⚡ Pro tip: There's actually a more elegant way to do this...\n\n",
+        "🎁 Quick follow-up: I also implemented...\n\n",
+    ),
+    "thread": (
+        "1/ Let's start a thread on why this matters 🧵\n\n",
+        "→ Quick follow-up:\n\n",
+        "📌 Building on this:\n\n",
+    ),
+}
+_REPLY_TYPES = tuple(_REPLY_TEMPLATES)
+
 
 class SelfHypeAmplifier:
     """Amplifies content by replying to own posts with follow-up content."""
@@ -17,6 +51,12 @@ class SelfHypeAmplifier:
         self.config = get_config()
         self.learning_system = LearningSystem()
         self.browser: Optional[BrowserAutomation] = None
+        self._rng = random.Random()
+        # Records collected while amplify_posts runs, written in one batch at its end
+        self._pending_amplifications: List[dict] = []
+        self._open_batches = 0
+        # Amplifications wait concurrently but share a single browser page
+        self._browser_lock = asyncio.Lock()
 
     async def initialize(self):
         """Initialize browser automation."""
@@ -62,7 +102,7 @@ class SelfHypeAmplifier:
                 print(f"✅ Successfully amplified post {post_id} on {platform}")
 
                 # Record the amplification
-                self._record_amplification(post_id, platform, reply_content)
+                await self._record_amplification(post_id, platform, reply_content)
 
             return success
 
@@ -70,22 +110,44 @@ class SelfHypeAmplifier:
             print(f"❌ Failed to amplify post: {e}")
             return False
 
+    async def amplify_posts(self, jobs: List[dict]) -> List[bool]:
+        """Amplify several posts concurrently.
+
+        The waits before each reply overlap, so scheduling N posts with the
+        same delay takes roughly one delay rather than N.
+
+        Args:
+            jobs: Keyword arguments for amplify_post, one dict per post
+
+        Returns:
+            Success flag for each job, in order
+        """
+        loop = asyncio.get_running_loop()
+        self._open_batches += 1
+        try:
+            # Eager tasks run up to their first wait immediately; only these tasks are
+            # eager, the loop's task factory is left alone for other libraries
+            tasks = [asyncio.eager_task_factory(loop, self.amplify_post(**job)) for job in jobs]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._open_batches -= 1
+            await self.flush_amplifications()
+        return [result is True for result in results]
+
     async def _wait_until(self, target_time: datetime):
         """Wait until target time.
 
         Args:
             target_time: Time to wait until
         """
-        now = datetime.now()
-        if now >= target_time:
+        wait_seconds = (target_time - datetime.now()).total_seconds()
+        if wait_seconds <= 0:
             return
 
-        wait_seconds = (target_time - now).total_seconds()
         print(f"⏳ Waiting {wait_seconds / 3600:.1f} hours...")
 
-        # Check every minute
-        while datetime.now() < target_time:
-            await asyncio.sleep(60)
+        # A single timer instead of waking up every minute
+        await asyncio.sleep(wait_seconds)
 
     def _generate_reply(self, reply_type: str) -> str:
         """Generate reply content.
@@ -96,38 +158,15 @@ class SelfHypeAmplifier:
         Returns:
             Reply content
         """
-        templates = {
-            "insight": [
-                "🧵 Here's a deeper dive into the technical details...\n\n",
-                "💡 The key insight behind this change is...\n\n",
-                "🔬 Technical breakdown:\n\n",
-            ],
-            "question": [
-                "❓ What do you think about this approach?\n\n",
-                "🤔 Has anyone faced similar challenges?\n\n",
-                "💬 Would love to hear your thoughts on this!\n\n",
-            ],
-            "teaser": [
-                "🔥 Bonus: Here's what I didn't mention in the original post...\n\n",
-                "⚡ Pro tip: There's actually a more elegant way to do this...\n\n",
-                "🎁 Quick follow-up: I also implemented...\n\n",
-            ],
-            "thread": [
-                "1/ Let's start a thread on why this matters 🧵\n\n",
-                "→ Quick follow-up:\n\n",
-                "📌 Building on this:\n\n",
-            ],
-        }
-
         if reply_type == "auto":
-            reply_type = random.choice(list(templates.keys()))
+            reply_type = self._rng.choice(_REPLY_TYPES)
 
-        template = random.choice(templates.get(reply_type, templates["insight"]))
+        template = self._rng.choice(_REPLY_TEMPLATES.get(reply_type, _REPLY_TEMPLATES["insight"]))
 
         # Get suggestions from learning system
         suggestions = self.learning_system.get_hook_suggestions(3)
         if suggestions:
-            suggestion = random.choice(suggestions)
+            suggestion = self._rng.choice(suggestions)
             return template + suggestion
 
         return template + "More details coming soon! #devlife #coding"
@@ -143,22 +182,23 @@ class SelfHypeAmplifier:
         Returns:
             True if successful
         """
-        if not self.browser:
-            await self.initialize()
+        async with self._browser_lock:
+            if not self.browser:
+                await self.initialize()
 
-        try:
-            if platform == "twitter":
-                return await self._reply_to_twitter(post_id, content)
-            elif platform == "linkedin":
-                return await self._reply_to_linkedin(post_id, content)
-            else:
-                print(f"❌ Unsupported platform: {platform}")
+            try:
+                if platform == "twitter":
+                    return await self._reply_to_twitter(post_id, content)
+                elif platform == "linkedin":
+                    return await self._reply_to_linkedin(post_id, content)
+                else:
+                    print(f"❌ Unsupported platform: {platform}")
+                    return False
+
+            except Exception as e:
+                print(f"❌ Failed to post reply: {e}")
                 return False
 
-        except Exception as e:
-            print(f"❌ Failed to post reply: {e}")
-            return False
-
     async def _reply_to_twitter(self, tweet_id: str, content: str) -> bool:
         """Reply to a tweet.
 
@@ -171,10 +211,9 @@ class SelfHypeAmplifier:
         """
         try:
             # Navigate to tweet
-            await self.browser.page.goto(f"https://twitter.com/i/status/{tweet_id}")
-
-            # Wait for page load
-            await asyncio.sleep(random.uniform(2.0, 4.0))
+            await self.browser.page.goto(
+                f"https://twitter.com/i/status/{tweet_id}", wait_until="domcontentloaded"
+            )
 
             # Find reply button and click
             reply_button = await self.browser.page.wait_for_selector(
@@ -183,17 +222,14 @@ class SelfHypeAmplifier:
             await reply_button.click()
 
             # Wait for composer
-            await asyncio.sleep(random.uniform(1.0, 2.0))
-
-            # Type reply
             text_box = await self.browser.page.wait_for_selector(
-                'div[contenteditable="true"][data-testid="tweetTextarea_0"]'
+                'div[contenteditable="true"][data-testid="tweetTextarea_0"]',
+                state="visible",
+                timeout=10000,
             )
 
-            # Simulate human typing
-            for char in content:
-                await text_box.type(char, delay=random.uniform(50, 150))
-                await asyncio.sleep(random.uniform(0.01, 0.05))
+            # Simulate human typing (per-key delay is applied by the browser)
+            await text_box.type(content, delay=random.uniform(50, 150))
 
             # Random pause before posting
             await asyncio.sleep(random.uniform(2.0, 4.0))
@@ -205,7 +241,7 @@ class SelfHypeAmplifier:
             await reply_submit.click()
 
             # Wait for post
-            await asyncio.sleep(random.uniform(2.0, 3.0))
+            await self._wait_for_twitter_toast()
 
             return True
 
@@ -225,10 +261,9 @@ class SelfHypeAmplifier:
         """
         try:
             # Navigate to post
-            await self.browser.page.goto(f"https://www.linkedin.com/feed/update/{post_id}")
-
-            # Wait for page load
-            await asyncio.sleep(random.uniform(2.0, 4.0))
+            await self.browser.page.goto(
+                f"https://www.linkedin.com/feed/update/{post_id}", wait_until="domcontentloaded"
+            )
 
             # Find comment button
             comment_button = await self.browser.page.wait_for_selector(
@@ -237,17 +272,12 @@ class SelfHypeAmplifier:
             await comment_button.click()
 
             # Wait for composer
-            await asyncio.sleep(random.uniform(1.0, 2.0))
-
-            # Type comment
             text_box = await self.browser.page.wait_for_selector(
-                'div[contenteditable="true"][role="textbox"]'
+                'div[contenteditable="true"][role="textbox"]', state="visible", timeout=10000
             )
 
-            # Simulate human typing
-            for char in content:
-                await text_box.type(char, delay=random.uniform(50, 150))
-                await asyncio.sleep(random.uniform(0.01, 0.05))
+            # Simulate human typing (per-key delay is applied by the browser)
+            await text_box.type(content, delay=random.uniform(50, 150))
 
             # Random pause before posting
             await asyncio.sleep(random.uniform(2.0, 4.0))
@@ -267,18 +297,56 @@ class SelfHypeAmplifier:
             print(f"❌ Failed to reply to LinkedIn post: {e}")
             return False
 
-    def _record_amplification(self, post_id: str, platform: str, content: str):
-        """Record amplification in learning system.
+    async def _wait_for_twitter_toast(self):
+        """Wait for Twitter's confirmation toast after submitting a post."""
+        try:
+            await self.browser.page.wait_for_selector('div[data-testid="toast"]', timeout=5000)
+        except PlaywrightTimeoutError:
+            # The toast is only a confirmation; the post has already been submitted
+            pass
+
+    async def _record_amplification(self, post_id: str, platform: str, content: str):
+        """Record an amplification in the learning system.
+
+        Inside amplify_posts the record is queued and written with the rest of
+        the batch; otherwise it is written right away.
 
         Args:
             post_id: Original post ID
             platform: Platform
             content: Reply content
         """
-        # This would be stored in the learning system
-        # for tracking amplification effectiveness
+        self._pending_amplifications.append({
+            "post_id": post_id,
+            "platform": platform,
+            "content": content,
+            "timestamp": datetime.now().isoformat(),
+        })
+        if not self._open_batches:
+            await self.flush_amplifications()
+
         print(f"📊 Recorded amplification for {post_id} on {platform}")
 
+    async def flush_amplifications(self):
+        """Write queued amplification records to the learning system."""
+        batch, self._pending_amplifications = self._pending_amplifications, []
+        if not batch:
+            return
+
+        try:
+            # One small append; stay on the loop thread since LearningSystem has no lock
+            self.learning_system.record_amplifications(batch)
+        except Exception as e:
+            print(f"⚠️  Failed to record amplifications: {e}")
+
+    async def close(self):
+        """Flush pending records and close the browser."""
+        await self.flush_amplifications()
+
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+
     async def create_thread(
         self,
         base_content: str,
@@ -319,18 +387,21 @@ class SelfHypeAmplifier:
     ) -> Optional[str]:
         """Create a Twitter thread.
 
+        The whole thread is composed in a single composer session when the
+        "add post" button is available; otherwise each part is posted as a
+        separate reply to the first tweet.
+
         Args:
             base_content: Main tweet
             thread_parts: Thread continuations
-            delay_between_posts: Seconds between posts
+            delay_between_posts: Seconds between posts (reply fallback only)
 
         Returns:
             First tweet ID
         """
         try:
-            # Post first tweet
-            await self.browser.page.goto("https://twitter.com")
-            await asyncio.sleep(random.uniform(2.0, 4.0))
+            # Compose first tweet
+            await self.browser.page.goto("https://twitter.com", wait_until="domcontentloaded")
 
             # Find composer
             tweet_box = await self.browser.page.wait_for_selector(
@@ -338,8 +409,27 @@ class SelfHypeAmplifier:
             )
 
             # Type content
-            for char in base_content:
-                await tweet_box.type(char, delay=random.uniform(50, 150))
+            await tweet_box.type(base_content, delay=random.uniform(50, 150))
+
+            # Append the continuations to the same composer if possible
+            add_button = None
+            if thread_parts:
+                add_button = await self.browser.page.query_selector('div[data-testid="addButton"]')
+
+            if add_button:
+                total = len(thread_parts) + 1
+                for i, part in enumerate(thread_parts, 1):
+                    await add_button.click()
+
+                    text_box = await self.browser.page.wait_for_selector(
+                        f'div[contenteditable="true"][data-testid="tweetTextarea_{i}"]',
+                        state="visible",
+                        timeout=10000,
+                    )
+                    await text_box.type(
+                        f"{i + 1}/{total} {part}",
+                        delay=random.uniform(50, 150),
+                    )
 
             # Post
             await asyncio.sleep(random.uniform(2.0, 4.0))
@@ -349,7 +439,7 @@ class SelfHypeAmplifier:
             await tweet_button.click()
 
             # Wait for post
-            await asyncio.sleep(random.uniform(2.0, 3.0))
+            await self._wait_for_twitter_toast()
 
             # Get tweet ID from URL
             url = self.browser.page.url
@@ -357,47 +447,65 @@ class SelfHypeAmplifier:
 
             print(f"✅ Posted first tweet: {first_tweet_id}")
 
-            # Post thread continuations
-            for i, part in enumerate(thread_parts, 2):
-                await asyncio.sleep(delay_between_posts)
+            if add_button:
+                print(f"✅ Posted {len(thread_parts)} thread parts")
+            else:
+                await self._reply_thread_parts(first_tweet_id, thread_parts, delay_between_posts)
 
-                # Find reply button on first tweet
-                await self.browser.page.goto(f"https://twitter.com/i/status/{first_tweet_id}")
-                await asyncio.sleep(random.uniform(2.0, 4.0))
+            return first_tweet_id
 
-                reply_button = await self.browser.page.wait_for_selector(
-                    'div[role="button"][data-testid="reply"]'
-                )
-                await reply_button.click()
+        except Exception as e:
+            print(f"❌ Failed to create Twitter thread: {e}")
+            return None
 
-                # Wait for composer
-                await asyncio.sleep(random.uniform(1.0, 2.0))
+    async def _reply_thread_parts(
+        self,
+        first_tweet_id: str,
+        thread_parts: List[str],
+        delay_between_posts: int,
+    ):
+        """Post thread continuations as individual replies to the first tweet.
 
-                # Add thread indicator
-                thread_content = f"{i}/{len(thread_parts) + 1} {part}"
+        Args:
+            first_tweet_id: ID of the thread's first tweet
+            thread_parts: Thread continuations
+            delay_between_posts: Seconds between posts
+        """
+        total = len(thread_parts) + 1
+        for i, part in enumerate(thread_parts, 2):
+            await asyncio.sleep(delay_between_posts)
 
-                # Type reply
-                text_box = await self.browser.page.wait_for_selector(
-                    'div[contenteditable="true"][data-testid="tweetTextarea_0"]'
-                )
+            # Find reply button on first tweet
+            await self.browser.page.goto(
+                f"https://twitter.com/i/status/{first_tweet_id}", wait_until="domcontentloaded"
+            )
 
-                for char in thread_content:
-                    await text_box.type(char, delay=random.uniform(50, 150))
+            reply_button = await self.browser.page.wait_for_selector(
+                'div[role="button"][data-testid="reply"]'
+            )
+            await reply_button.click()
 
-                # Post
-                await asyncio.sleep(random.uniform(2.0, 4.0))
-                reply_submit = await self.browser.page.wait_for_selector(
-                    'div[data-testid="tweetButtonInline"] span:has-text("Reply")'
-                )
-                await reply_submit.click()
+            # Add thread indicator
+            thread_content = f"{i}/{total} {part}"
 
-                print(f"✅ Posted thread part {i}")
+            # Wait for composer
+            text_box = await self.browser.page.wait_for_selector(
+                'div[contenteditable="true"][data-testid="tweetTextarea_0"]',
+                state="visible",
+                timeout=10000,
+            )
 
-            return first_tweet_id
+            await text_box.type(thread_content, delay=random.uniform(50, 150))
 
-        except Exception as e:
-            print(f"❌ Failed to create Twitter thread: {e}")
-            return None
+            # Post
+            await asyncio.sleep(random.uniform(2.0, 4.0))
+            reply_submit = await self.browser.page.wait_for_selector(
+                'div[data-testid="tweetButtonInline"] span:has-text("Reply")'
+            )
+            await reply_submit.click()
+            await self._wait_for_twitter_toast()
+
+            print(f"✅ Posted thread part {i}")
 
 
 class AmplificationStrategy:
@@ -444,11 +552,7 @@ class AmplificationStrategy:
         """
         content_lower = post_content.lower()
 
-        if any(word in content_lower for word in ["feature", "launched", "released"]):
-            return "teaser"
-        elif any(word in content_lower for word in ["how", "tutorial", "guide"]):
-            return "insight"
-        elif any(word in content_lower for word in ["problem", "issue", "bug"]):
-            return "question"
-        else:
-            return "thread"
+        for keywords, reply_type in _REPLY_TYPE_MATCHERS:
+            if any(word in content_lower for word in keywords):
+                return reply_type
+        return "thread"
@@ -1,126 +1,34 @@
 """Visual rendering engine for creating beautiful code snapshots."""
+import asyncio
 import hashlib
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 from jinja2 import Template
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Page, Playwright, Route, async_playwright
 
 from ..config import get_config
 
+ImageFormat = Literal["png", "jpeg"]
 
-class VisualEngine:
-    """Renders visual assets using HTML/CSS/JS."""
-
-    def __init__(self):
-        """Initialize the visual engine."""
-        self.config = get_config()
-
-    def generate_entropy_seed(self, commit_hash: str) -> float:
-        """Generate entropy seed from commit hash.
-
-        Args:
-            commit_hash: Git commit hash
-
-        Returns:
-            Float value between 0 and 1
-        """
-        hash_bytes = hashlib.sha256(commit_hash.encode()).digest()
-        return int.from_bytes(hash_bytes[:4], byteorder="big") / (2**32)
-
-    async def render_template(
-        self,
-        template_name: str,
-        data: dict,
-        commit_hash: Optional[str] = None,
-        output_path: Optional[Path] = None,
-    ) -> bytes:
-        """Render a template to an image.
-
-        Args:
-            template_name: Name of the template (e.g., "carbon_x", "bento_metrics")
-            data: Data to populate the template
-            commit_hash: Optional commit hash for entropy seeding
-            output_path: Optional path to save the image
-
-        Returns:
-            Image bytes
-        """
-        # Generate entropy seed if commit hash provided
-        entropy = self.generate_entropy_seed(commit_hash or "default")
-
-        # Load and render template
-        template_html = self._load_template(template_name)
-        rendered = template_html.render(
-            **data,
-            entropy=entropy,
-            config=self.config.config,
-        )
-
-        # Take screenshot with Playwright
-        screenshot = await self._screenshot_html(rendered, output_path)
-
-        return screenshot
-
-    def _load_template(self, template_name: str) -> Template:
-        """Load a Jinja2 template.
+# JPEG quality used for social-media renders
+_JPEG_QUALITY = 90
 
-        Args:
-            template_name: Name of the template
+# Number of rendered images kept in memory per engine
+RENDER_CACHE_SIZE = 16
 
-        Returns:
-            Jinja2 Template object
-        """
-        # This will be implemented when we create the actual templates
-        # For now, return a basic template
-        if template_name == "carbon_x":
-            template_string = self._get_carbon_x_template()
-        elif template_name == "bento_metrics":
-            template_string = self._get_bento_metrics_template()
-        else:
-            template_string = "<html><body>{{ data }}</body></html>"
-
-        return Template(template_string)
-
-    async def _screenshot_html(self, html: str, output_path: Optional[Path] = None) -> bytes:
-        """Take a screenshot of HTML content.
-
-        Args:
-            html: HTML content to screenshot
-            output_path: Optional path to save the screenshot
-
-        Returns:
-            Image bytes
-        """
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch()
-            page = await browser.new_page(
-                viewport={"width": 1200, "height": 800},
-                device_scale_factor=self.config.get("browser.screenshot_scale", 2.0),
-            )
-
-            # Set HTML content
-            await page.set_content(html, wait_until="networkidle")
-
-            # Take screenshot
-            screenshot = await page.screenshot(
-                type="png",
-                path=str(output_path) if output_path else None,
-                full_page=False,
-            )
-
-            await browser.close()
+# Pages rendering at once; Chromium gives each its own renderer process
+RENDER_PAGES = min(4, os.cpu_count() or 1)
 
-            return screenshot
+# Web font stylesheets and files imported by the templates
+_FONT_URL_PATTERN = re.compile(r"^https://fonts\.(googleapis|gstatic)\.com/")
 
-    def _get_carbon_x_template(self) -> str:
-        """Get the Carbon-X template HTML.
 
-        Returns:
-            HTML template string
-        """
-        return """
+_CARBON_X_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -273,13 +181,7 @@ class VisualEngine:
 </html>
         """
 
-    def _get_bento_metrics_template(self) -> str:
-        """Get the Bento-Metrics template HTML.
-
-        Returns:
-            HTML template string
-        """
-        return """
+_BENTO_METRICS_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -439,3 +341,281 @@ class VisualEngine:
 </body>
 </html>
         """
+
+
+@dataclass(slots=True)
+class VisualData:
+    """Repository summary rendered by the bento_metrics template as ``data``."""
+
+    repo_name: str
+    description: str
+    total_commits: int
+    recent_count: int
+    marketing_hooks: List[str]
+    visual_highlights: List[str]
+    branding: Optional[str] = None
+
+
+class VisualEngine:
+    """Renders visual assets using HTML/CSS/JS."""
+
+    def __init__(self):
+        """Initialize the visual engine."""
+        self.config = get_config()
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle_pages: List[Page] = []
+        self._page_scale: Optional[float] = None
+        self._render_slots = asyncio.Semaphore(RENDER_PAGES)
+        self._launch_lock = asyncio.Lock()
+        self._template_cache: Dict[str, Template] = {}
+        self._render_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._font_cache: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+
+    async def _acquire_page(self) -> Page:
+        """Take an idle render page, opening a new one if none is free.
+
+        Idle pages are discarded if the configured screenshot scale has
+        changed since they were opened. Chromium is launched on first use.
+
+        Returns:
+            Page reserved for one render
+        """
+        scale = self.config.get("browser.screenshot_scale", 2.0)
+        if self._page_scale != scale:
+            await self._close_idle_pages()
+            self._page_scale = scale
+
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch()
+
+        context = await self._browser.new_context(
+            viewport={"width": 1200, "height": 800},
+            device_scale_factor=scale,
+        )
+        await context.route(_FONT_URL_PATTERN, self._serve_font)
+        return await context.new_page()
+
+    async def _release_page(self, page: Page, reusable: bool = True):
+        """Return a page to the idle pool, or close it.
+
+        Args:
+            page: Page taken with _acquire_page
+            reusable: False to close the page instead of reusing it
+        """
+        scale = self.config.get("browser.screenshot_scale", 2.0)
+        if reusable and not page.is_closed() and scale == self._page_scale:
+            self._idle_pages.append(page)
+        else:
+            await self._close_page(page)
+
+    async def _close_page(self, page: Page):
+        """Close a render page and its context."""
+        try:
+            await page.context.close()
+        except Exception as e:
+            print(f"⚠️  Could not close render context: {e}")
+
+    async def _close_idle_pages(self):
+        """Close every idle render page."""
+        pages, self._idle_pages = self._idle_pages, []
+        for page in pages:
+            await self._close_page(page)
+
+    async def close(self):
+        """Close the shared browser and stop Playwright."""
+        await self._close_idle_pages()
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def generate_entropy_seed(self, commit_hash: str) -> float:
+        """Generate entropy seed from commit hash.
+
+        Args:
+            commit_hash: Git commit hash
+
+        Returns:
+            Float value between 0 and 1
+        """
+        # Git hashes are already uniformly distributed hex digests, so their
+        # leading 32 bits can be used directly without re-hashing
+        if len(commit_hash) >= 8:
+            try:
+                return int(commit_hash[:8], 16) / (2**32)
+            except ValueError:
+                pass
+
+        # Non-hex input (e.g. the "default" sentinel) still needs a stable digest
+        hash_bytes = hashlib.sha256(commit_hash.encode()).digest()
+        return int.from_bytes(hash_bytes[:4], byteorder="big") / (2**32)
+
+    async def render_template(
+        self,
+        template_name: str,
+        data: dict,
+        commit_hash: Optional[str] = None,
+        output_path: Optional[Path] = None,
+        image_format: Optional[ImageFormat] = None,
+    ) -> bytes:
+        """Render a template to an image.
+
+        Args:
+            template_name: Name of the template (e.g., "carbon_x", "bento_metrics")
+            data: Data to populate the template
+            commit_hash: Optional commit hash for entropy seeding
+            output_path: Optional path to save the image
+            image_format: "png" or "jpeg"; defaults to PNG for ".png" output
+                paths and JPEG otherwise
+
+        Returns:
+            Image bytes
+        """
+        # Generate entropy seed if commit hash provided
+        entropy = self.generate_entropy_seed(commit_hash or "default")
+
+        # Load and render template (off the event loop, it can take a while)
+        template_html = self._load_template(template_name)
+        rendered = await asyncio.to_thread(
+            template_html.render,
+            **data,
+            entropy=entropy,
+            config=self.config.config,
+        )
+
+        # Pick the output format
+        if image_format is None:
+            is_png = output_path is not None and output_path.suffix.lower() == ".png"
+            image_format = "png" if is_png else "jpeg"
+
+        # Identical HTML at the same scale renders to an identical image, so reuse
+        # earlier screenshots
+        scale = self.config.get("browser.screenshot_scale", 2.0)
+        cache_key = hashlib.blake2b(
+            f"{image_format}|{scale}|{rendered}".encode(), digest_size=16
+        ).digest()
+        screenshot = self._render_cache.get(cache_key)
+        if screenshot is not None:
+            self._render_cache.move_to_end(cache_key)
+        else:
+            screenshot = await self._screenshot_html(rendered, image_format)
+            self._render_cache[cache_key] = screenshot
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+
+        # Write the file off the event loop; bytes-only callers skip disk entirely
+        if output_path:
+            await asyncio.to_thread(output_path.write_bytes, screenshot)
+
+        return screenshot
+
+    def _load_template(self, template_name: str) -> Template:
+        """Load a Jinja2 template.
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            Jinja2 Template object
+        """
+        cached = self._template_cache.get(template_name)
+        if cached is not None:
+            return cached
+
+        # This will be implemented when we create the actual templates
+        # For now, return a basic template
+        if template_name == "carbon_x":
+            template_string = self._get_carbon_x_template()
+        elif template_name == "bento_metrics":
+            template_string = self._get_bento_metrics_template()
+        else:
+            template_string = "<html><body>{{ data }}</body></html>"
+
+        template = Template(template_string)
+        self._template_cache[template_name] = template
+        return template
+
+    async def _screenshot_html(self, html: str, image_format: ImageFormat = "png") -> bytes:
+        """Take a screenshot of HTML content.
+
+        Args:
+            html: HTML content to screenshot
+            image_format: "png" or "jpeg"
+
+        Returns:
+            Image bytes
+        """
+        async with self._render_slots:
+            page = await self._acquire_page()
+            try:
+                # Set HTML content; "load" plus document.fonts.ready covers the web
+                # fonts without networkidle's 500ms quiet period
+                await page.set_content(html, wait_until="load")
+                await page.evaluate("document.fonts.ready.then(() => true)")
+
+                # Take screenshot
+                screenshot = await page.screenshot(
+                    type=image_format,
+                    quality=_JPEG_QUALITY if image_format == "jpeg" else None,
+                    full_page=False,
+                )
+            except Exception:
+                # Don't hand a broken page to the next render
+                await self._release_page(page, reusable=False)
+                raise
+
+            await self._release_page(page)
+            return screenshot
+
+    async def _serve_font(self, route: Route):
+        """Serve Google Fonts requests from memory after the first download.
+
+        The cache outlives the render pages, which are recreated after errors
+        or scale changes, so fonts are only downloaded once per engine.
+
+        Args:
+            route: Intercepted font request
+        """
+        url = route.request.url
+        cached = self._font_cache.get(url)
+        if cached is None:
+            try:
+                response = await route.fetch()
+                cached = (response.status, response.headers, await response.body())
+            except Exception as e:
+                # Offline or blocked: let the page fall back to its system fonts
+                print(f"⚠️  Could not fetch font {url}: {e}")
+                await route.abort()
+                return
+            if response.ok:
+                self._font_cache[url] = cached
+
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    def _get_carbon_x_template(self) -> str:
+        """Get the Carbon-X template HTML.
+
+        Returns:
+            HTML template string
+        """
+        return _CARBON_X_TEMPLATE
+
+    def _get_bento_metrics_template(self) -> str:
+        """Get the Bento-Metrics template HTML.
+
+        Returns:
+            HTML template string
+        """
+        return _BENTO_METRICS_TEMPLATE
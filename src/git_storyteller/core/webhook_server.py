@@ -1,34 +1,67 @@
 """GitHub webhook server for real-time social media posting."""
 import asyncio
 import hmac
-import json
+import itertools
+import shutil
+import signal
+import socket
+import tempfile
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from aiohttp import web
 
 from ..config import get_config
+from ..utils.aio import run
 from .browser_automation import BrowserAutomation
 from .git_analyzer import GitAnalyzer
-from .visual_engine import VisualEngine
+from .visual_engine import VisualData, VisualEngine
+
+# Repository analyses (git clones) allowed to run at once
+MAX_CONCURRENT_ANALYSES = 4
+
+# Bodies at least this large are HMAC-verified in a worker thread
+_THREADED_VERIFY_MIN_BYTES = 64 * 1024
+
+# GitHub events with a handler; anything else is acknowledged unread
+_HANDLED_EVENTS = frozenset({"push", "pull_request", "release"})
 
 
 class WebhookServer:
     """GitHub webhook server for autonomous storytelling."""
 
-    def __init__(self, port: int = 8080, secret: Optional[str] = None):
+    def __init__(self, port: int = 8080, secret: Optional[str] = None, host: str = "localhost"):
         """Initialize the webhook server.
 
         Args:
             port: Port to listen on
             secret: GitHub webhook secret for signature verification
+            host: Interface to bind ("0.0.0.0" to accept external connections)
         """
+        self.host = host
         self.port = port
         self.secret = secret
+        self._secret_bytes = secret.encode() if secret else None
         self.config = get_config()
         self.git_analyzer = GitAnalyzer()
         self.visual_engine = VisualEngine()
         self.browser: Optional[BrowserAutomation] = None
+        # Guards browser start-up and serializes posts through its single page
+        self._browser_lock = asyncio.Lock()
+        self._analysis_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        self._push_template = (
+            "bento_metrics" if self.config.get("templates.bento_metrics.enabled") else "carbon_x"
+        )
+        self._enabled_platforms = [
+            platform
+            for platform in ("twitter", "linkedin")
+            if self.config.get(f"social.{platform}.enabled")
+        ]
+        # Rendered push images, in a private (0700) directory removed on shutdown;
+        # each image is deleted once it has been posted
+        self._img_dir = Path(tempfile.mkdtemp(prefix="git-storyteller-img-"))
+        self._img_counter = itertools.count()
         self.app = web.Application()
         self._setup_routes()
 
@@ -62,14 +95,19 @@ class WebhookServer:
         if not self.secret:
             return True  # Skip verification if no secret configured
 
-        hash_algorithm, github_signature = signature.split("=", 1)
-        if hash_algorithm != "sha256":
-            return False
+        # partition() never raises on a malformed header
+        hash_algorithm, _, github_signature = signature.partition("=")
 
-        mac = hmac.new(self.secret.encode(), msg=payload, digestmod="sha256")
-        expected_signature = mac.hexdigest()
+        # One-shot OpenSSL HMAC, no Python-level HMAC object
+        expected_signature = hmac.digest(self._secret_bytes, payload, "sha256").hex()
 
-        return hmac.compare_digest(expected_signature, github_signature)
+        # Always do the same work: compare a fixed-length candidate and fold the
+        # algorithm and length checks in afterwards instead of returning early
+        candidate = github_signature.ljust(64, "0")[:64]
+        matches = hmac.compare_digest(
+            expected_signature.encode(), candidate.encode("utf-8", "replace")
+        )
+        return matches & (hash_algorithm == "sha256") & (len(github_signature) == 64)
 
     async def handle_github_webhook(self, request: web.Request) -> web.Response:
         """Handle incoming GitHub webhook.
@@ -80,14 +118,29 @@ class WebhookServer:
         Returns:
             Web response
         """
+        # Ignore events we don't handle before reading or verifying the body
+        event_type = request.headers.get("X-GitHub-Event", "")
+        if event_type not in _HANDLED_EVENTS:
+            print(f"⚠️  Unsupported event type: {event_type}")
+            return web.json_response({"status": "ignored"}, status=202)
+
+        # Read the body once for both signature verification and parsing
+        body = await request.read()
+
         # Verify signature
         signature = request.headers.get("X-Hub-Signature-256")
-        if signature and not self._verify_signature(await request.read(), signature):
-            return web.json_response({"error": "Invalid signature"}, status=401)
+        if signature:
+            # OpenSSL releases the GIL while hashing, so large bodies from
+            # concurrent deliveries are verified in parallel off the loop
+            if len(body) >= _THREADED_VERIFY_MIN_BYTES:
+                valid = await asyncio.to_thread(self._verify_signature, body, signature)
+            else:
+                valid = self._verify_signature(body, signature)
+            if not valid:
+                return web.json_response({"error": "Invalid signature"}, status=401)
 
         # Parse event
-        event_type = request.headers.get("X-GitHub-Event", "")
-        payload = await request.json()
+        payload = orjson.loads(body)
 
         print(f"📩 Received webhook event: {event_type}")
 
@@ -98,8 +151,6 @@ class WebhookServer:
             await self._handle_pull_request_event(payload)
         elif event_type == "release":
             await self._handle_release_event(payload)
-        else:
-            print(f"⚠️  Unsupported event type: {event_type}")
 
         return web.json_response({"status": "processed"})
 
@@ -123,40 +174,41 @@ class WebhookServer:
 
             print(f"📦 Push to {repo_name}/{branch} with {len(commits)} commit(s)")
 
-            # Analyze repository
-            impact = self.git_analyzer.analyze(repo_url, ref=branch, is_remote=True)
-
-            # Generate visual
-            template = self.config.get("templates.bento_metrics.enabled") and "bento_metrics" or "carbon_x"
+            # Analyze repository (clones in a worker thread to keep the loop responsive)
+            async with self._analysis_semaphore:
+                impact = await asyncio.to_thread(
+                    self.git_analyzer.analyze, repo_url, ref=branch, is_remote=True
+                )
 
             # Prepare data for template
-            visual_data = {
-                "repo_name": impact.name,
-                "description": impact.description,
-                "total_commits": impact.total_commits,
-                "recent_count": len(impact.recent_changes),
-                "marketing_hooks": impact.marketing_hooks,
-                "visual_highlights": impact.visual_highlights,
-            }
+            visual_data = VisualData(
+                repo_name=impact.name,
+                description=impact.description,
+                total_commits=impact.total_commits,
+                recent_count=len(impact.recent_changes),
+                marketing_hooks=impact.marketing_hooks,
+                visual_highlights=impact.visual_highlights,
+            )
 
             # Generate image
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-                image_path = f.name
+            image_path = self._img_dir / f"push_{next(self._img_counter)}.jpg"
 
             latest_commit = impact.recent_changes[0] if impact.recent_changes else None
-            await self.visual_engine.render_template(
-                template_name=template,
-                data=visual_data,
-                commit_hash=latest_commit.hash if latest_commit else None,
-                output_path=Path(image_path),
-            )
+            try:
+                await self.visual_engine.render_template(
+                    template_name=self._push_template,
+                    data={"data": visual_data},
+                    commit_hash=latest_commit.hash if latest_commit else None,
+                    output_path=image_path,
+                )
 
-            # Generate caption
-            caption = self._generate_push_caption(repo_name, branch, commits, impact)
+                # Generate caption
+                caption = self._generate_push_caption(repo_name, branch, commits, impact)
 
-            # Post to enabled platforms
-            await self._post_to_platforms(caption, image_path)
+                # Post to enabled platforms
+                await self._post_to_platforms(caption, str(image_path))
+            finally:
+                image_path.unlink(missing_ok=True)
 
             print(f"✅ Successfully processed push event for {repo_name}")
 
@@ -240,22 +292,25 @@ class WebhookServer:
         Returns:
             Generated caption
         """
-        caption = f"🚀 Just pushed {len(commits)} commit{'s' if len(commits) > 1 else ''} to {repo_name}/{branch}!\n\n"
+        parts = [
+            f"🚀 Just pushed {len(commits)} commit{'s' if len(commits) > 1 else ''} to {repo_name}/{branch}!\n\n"
+        ]
 
         # Add marketing hooks
-        for hook in impact.marketing_hooks[:3]:
-            caption += f"• {hook}\n"
+        parts.extend(f"• {hook}\n" for hook in impact.marketing_hooks[:3])
 
-        caption += "\n"
+        parts.append("\n")
 
-        # Add commit messages
+        # Add commit messages (push payloads carry a plain string; some callers a dict)
         for commit in commits[:3]:
-            message = commit.get("message", {}).get("headline", commit.get("message", ""))
-            caption += f"• {message[:60]}...\n"
+            message = commit.get("message", "")
+            if isinstance(message, dict):
+                message = message.get("headline", "")
+            parts.append(f"• {message[:60]}...\n")
 
-        caption += f"\n💻 View changes: {commits[0].get('url', '')}"
+        parts.append(f"\n💻 View changes: {commits[0].get('url', '')}")
 
-        return caption
+        return "".join(parts)
 
     def _generate_pr_caption(self, pr: dict, impact) -> str:
         """Generate caption for pull request.
@@ -267,15 +322,13 @@ class WebhookServer:
         Returns:
             Generated caption
         """
-        caption = f"🔀 Opened PR in {pr['base']['repo']['name']}: {pr['title']}\n\n"
-
-        caption += f"{pr.get('body', '')[:200]}\n\n"
-
-        # Add stats
-        caption += f"📊 +{pr.get('additions', 0)} -{pr.get('deletions', 0)} lines\n"
-        caption += f"🔗 {pr['html_url']}"
-
-        return caption
+        return "".join((
+            f"🔀 Opened PR in {pr['base']['repo']['name']}: {pr['title']}\n\n",
+            f"{pr.get('body', '')[:200]}\n\n",
+            # Add stats
+            f"📊 +{pr.get('additions', 0)} -{pr.get('deletions', 0)} lines\n",
+            f"🔗 {pr['html_url']}",
+        ))
 
     async def _post_to_platforms(self, caption: str, image_path: Optional[str]):
         """Post to enabled social platforms.
@@ -284,24 +337,20 @@ class WebhookServer:
             caption: Post caption
             image_path: Optional path to image
         """
-        if not self.browser:
-            self.browser = BrowserAutomation()
-            await self.browser.initialize()
-
-        platforms = []
-        if self.config.get("social.twitter.enabled"):
-            platforms.append("twitter")
-        if self.config.get("social.linkedin.enabled"):
-            platforms.append("linkedin")
-
-        for platform in platforms:
-            try:
-                if platform == "twitter":
-                    await self.browser.post_to_twitter(caption, image_path=Path(image_path) if image_path else None)
-                elif platform == "linkedin":
-                    await self.browser.post_to_linkedin(caption, image_path=Path(image_path) if image_path else None)
-            except Exception as e:
-                print(f"❌ Failed to post to {platform}: {e}")
+        async with self._browser_lock:
+            if self.browser is None:
+                self.browser = BrowserAutomation()
+                await self.browser.initialize()
+
+            image = Path(image_path) if image_path else None
+            for platform in self._enabled_platforms:
+                try:
+                    if platform == "twitter":
+                        await self.browser.post_to_twitter(caption, image_path=image)
+                    elif platform == "linkedin":
+                        await self.browser.post_to_linkedin(caption, image_path=image)
+                except Exception as e:
+                    print(f"❌ Failed to post to {platform}: {e}")
 
     async def test_webhook(self, request: web.Request) -> web.Response:
         """Test webhook endpoint.
@@ -312,10 +361,12 @@ class WebhookServer:
         Returns:
             Test response
         """
-        payload = await request.json()
+        body = await request.read()
+        payload = orjson.loads(body)
 
-        print("🧪 Testing webhook with payload:")
-        print(json.dumps(payload, indent=2))
+        print(f"🧪 Testing webhook with {len(body)} byte payload")
+        if self.config.get("debug"):
+            print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
 
         return web.json_response({"status": "test processed", "payload": payload})
 
@@ -324,26 +375,50 @@ class WebhookServer:
         print(f"🚀 Starting Git-Storyteller webhook server on port {self.port}")
         runner = web.AppRunner(self.app)
         await runner.setup()
-        site = web.TCPSite(runner, "localhost", self.port)
+        # SO_REUSEPORT lets extra worker processes share the listener where supported
+        site = web.TCPSite(
+            runner,
+            self.host,
+            self.port,
+            backlog=512,
+            reuse_port=hasattr(socket, "SO_REUSEPORT") or None,
+        )
         await site.start()
-        print(f"✅ Webhook server listening on http://localhost:{self.port}")
-        print(f"📡 Webhook endpoint: http://localhost:{self.port}/webhook/github")
+        print(f"✅ Webhook server listening on http://{self.host}:{self.port}")
+        print(f"📡 Webhook endpoint: http://{self.host}:{self.port}/webhook/github")
+
+        # Keep server running until SIGINT/SIGTERM
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on this platform; Ctrl+C still cancels the task
 
-        # Keep server running
         try:
-            while True:
-                await asyncio.sleep(3600)
-        except KeyboardInterrupt:
+            await stop_event.wait()
+        finally:
             print("\n🛑 Shutting down webhook server...")
             await runner.cleanup()
+            # Stop the long-lived Chromium instances so they don't outlive the server
+            try:
+                await self.visual_engine.close()
+                if self.browser:
+                    await self.browser.close()
+                    self.browser = None
+            except Exception as e:
+                print(f"⚠️  Could not close browsers: {e}")
+            shutil.rmtree(self._img_dir, ignore_errors=True)
 
 
-def run_webhook_server(port: int = 8080, secret: Optional[str] = None):
+def run_webhook_server(port: int = 8080, secret: Optional[str] = None, host: str = "localhost"):
     """Run the webhook server.
 
     Args:
         port: Port to listen on
         secret: Optional GitHub webhook secret
+        host: Interface to bind
     """
-    server = WebhookServer(port=port, secret=secret)
-    asyncio.run(server.start())
+    server = WebhookServer(port=port, secret=secret, host=host)
+    run(server.start())
@@ -0,0 +1,28 @@
+"""Event loop helpers shared across git-storyteller."""
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop's libuv-backed loop when it is installed and falls back to
+    the default asyncio loop otherwise.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
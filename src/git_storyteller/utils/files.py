@@ -0,0 +1,37 @@
+"""File helpers shared across git-storyteller."""
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Replace a file's contents atomically.
+
+    The data is written and fsynced to a sibling temp file which is then
+    renamed over the target, so a crash leaves either the old or the new
+    file on disk, never a truncated one.
+
+    Args:
+        path: File to write
+        data: New file contents
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+    # Persist the rename itself (not supported on every platform)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
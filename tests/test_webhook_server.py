@@ -0,0 +1,59 @@
+"""Tests for GitHub webhook signature verification."""
+import hmac
+import shutil
+
+import pytest
+
+from git_storyteller.core.webhook_server import WebhookServer
+
+SECRET = "s3cret"
+BODY = b'{"ref": "refs/heads/main"}'
+
+
+def sign(body, algo="sha256"):
+    """Compute a GitHub-style X-Hub-Signature header value."""
+    return f"{algo}=" + hmac.new(SECRET.encode(), body, algo).hexdigest()
+
+
+@pytest.fixture
+def server():
+    server = WebhookServer(secret=SECRET)
+    yield server
+    shutil.rmtree(server._img_dir, ignore_errors=True)
+
+
+def test_valid_signature(server):
+    assert server._verify_signature(BODY, sign(BODY)) is True
+
+
+def test_signature_for_other_payload(server):
+    assert server._verify_signature(BODY, sign(b"tampered")) is False
+
+
+def test_uppercase_signature_rejected(server):
+    algo, _, digest = sign(BODY).partition("=")
+    assert server._verify_signature(BODY, f"{algo}={digest.upper()}") is False
+
+
+def test_wrong_algorithm_rejected(server):
+    digest = sign(BODY).partition("=")[2]
+    assert server._verify_signature(BODY, f"sha1={digest}") is False
+    assert server._verify_signature(BODY, sign(BODY, "sha1")) is False
+
+
+def test_truncated_signature_rejected(server):
+    assert server._verify_signature(BODY, sign(BODY)[:-1]) is False
+    assert server._verify_signature(BODY, "sha256=") is False
+    assert server._verify_signature(BODY, "") is False
+
+
+def test_non_ascii_signature_rejected(server):
+    assert server._verify_signature(BODY, "sha256=" + "é" * 64) is False
+
+
+def test_no_secret_skips_verification():
+    server = WebhookServer()
+    try:
+        assert server._verify_signature(BODY, "") is True
+    finally:
+        shutil.rmtree(server._img_dir, ignore_errors=True)